@@ -3,12 +3,21 @@ Pydantic models for API requests and responses
 Defines data validation and serialization for the Audio Transcriber API
 """
 
-from typing import Optional, List, Dict, Any, Union
+import re
+from typing import Optional, List, Dict, Any
 from enum import Enum
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, ConfigDict, Field, validator
 from datetime import datetime
 
 
+# Characters not allowed in filenames, compiled once at import
+_INVALID_FILENAME_CHARS = '<>:"|?*'
+_INVALID_FILENAME_RE = re.compile(f"[{re.escape(_INVALID_FILENAME_CHARS)}]")
+
+# Response models are built once and serialized, never modified
+_RESPONSE_CONFIG = ConfigDict(frozen=True, validate_assignment=False)
+
+
 class TaskPriority(int, Enum):
     """Task priority levels"""
     DELETE = 0
@@ -49,6 +58,7 @@ class ComputeType(str, Enum):
     FLOAT16 = "float16"
     FLOAT32 = "float32"
     INT8 = "int8"
+    INT8_FLOAT16 = "int8_float16"
 
 
 class OutputFormat(str, Enum):
@@ -65,7 +75,7 @@ class TranscribeRequest(BaseModel):
     filename: str = Field(..., description="Name of the audio file to transcribe")
     language: Optional[str] = Field(None, description="Language code (e.g., 'en', 'ru') or None for auto-detection")
     model: WhisperModel = Field(WhisperModel.SMALL, description="Whisper model to use")
-    compute_type: ComputeType = Field(ComputeType.FLOAT32, description="Compute precision type")
+    compute_type: Optional[ComputeType] = Field(None, description="Compute precision type (default: int8 on CPU, int8_float16 on GPU)")
     output_format: OutputFormat = Field(OutputFormat.JSON, description="Output format")
     debug: bool = Field(False, description="Enable debug mode for detailed responses")
     temperature: float = Field(0.0, description="Sampling temperature", ge=0.0, le=1.0)
@@ -73,6 +83,8 @@ class TranscribeRequest(BaseModel):
     best_of: int = Field(5, description="Number of candidates to consider", ge=1)
     patience: float = Field(1.0, description="Patience for beam search", ge=0.0)
     word_timestamps: bool = Field(True, description="Include word-level timestamps")
+    batch_size: Optional[int] = Field(None, description="WhisperX batch size (default: based on CPU count)", ge=1)
+    timeout: Optional[int] = Field(None, description="Processing timeout in seconds, can only lower the default based on audio length", ge=1)
 
     @validator('filename')
     def validate_filename(cls, v):
@@ -81,15 +93,21 @@ class TranscribeRequest(BaseModel):
             raise ValueError("Filename cannot be empty")
 
         # Check for invalid characters
-        invalid_chars = ['<', '>', ':', '"', '|', '?', '*']
-        if any(char in v for char in invalid_chars):
-            raise ValueError(f"Filename contains invalid characters: {invalid_chars}")
+        if _INVALID_FILENAME_RE.search(v):
+            raise ValueError(f"Filename contains invalid characters: {list(_INVALID_FILENAME_CHARS)}")
 
         return v.strip()
 
 
+class BatchTranscribeRequest(BaseModel):
+    """Request model for batch transcription API"""
+    items: List[TranscribeRequest] = Field(..., description="Files to transcribe", min_length=1, max_length=100)
+
+
 class TranscribeResponse(BaseModel):
     """Response model for transcription API"""
+    model_config = _RESPONSE_CONFIG
+
     status: TaskStatus
     filename: str
     task_id: Optional[str] = None
@@ -99,6 +117,15 @@ class TranscribeResponse(BaseModel):
     queue_position: Optional[int] = None
 
 
+class BatchTranscribeResponse(BaseModel):
+    """Response model for batch transcription API"""
+    model_config = _RESPONSE_CONFIG
+
+    status: str
+    queued: int = Field(0, description="Number of files added to the queue")
+    items: List[TranscribeResponse] = Field(default_factory=list)
+
+
 class DeleteRequest(BaseModel):
     """Request model for deletion API"""
     filename: str = Field(..., description="Name of the file to delete")
@@ -107,6 +134,8 @@ class DeleteRequest(BaseModel):
 
 class DeleteResponse(BaseModel):
     """Response model for deletion API"""
+    model_config = _RESPONSE_CONFIG
+
     status: str
     filename: str
     message: str
@@ -115,6 +144,8 @@ class DeleteResponse(BaseModel):
 
 class StatusResponse(BaseModel):
     """Response model for status check API"""
+    model_config = _RESPONSE_CONFIG
+
     status: TaskStatus
     filename: str
     progress: Optional[float] = Field(None, description="Processing progress (0-100)")
@@ -151,6 +182,8 @@ class TranscriptionResult(BaseModel):
 
 class ResultResponse(BaseModel):
     """Response model for result retrieval API"""
+    model_config = _RESPONSE_CONFIG
+
     status: str
     filename: str
     result: Optional[TranscriptionResult] = None
@@ -159,6 +192,8 @@ class ResultResponse(BaseModel):
 
 class HealthCheckResponse(BaseModel):
     """Response model for health check"""
+    model_config = _RESPONSE_CONFIG
+
     status: str
     service: str
     version: str
@@ -4,29 +4,97 @@ Implements all REST endpoints according to specification
 """
 
 import asyncio
-import logging
-from typing import Optional
-from fastapi import APIRouter, HTTPException, Query, Depends
-from fastapi.responses import JSONResponse
+import shutil
+import time
+from typing import Dict, Tuple
+
+import psutil
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel
 
 from api.models import (
-    TranscribeRequest, TranscribeResponse, DeleteRequest, DeleteResponse,
+    TranscribeRequest, TranscribeResponse, BatchTranscribeRequest,
+    BatchTranscribeResponse, DeleteRequest, DeleteResponse,
     StatusResponse, ResultResponse, HealthCheckResponse, TaskStatus,
-    TaskPriority, ErrorResponse
+    TaskPriority
 )
 from core.logger import get_logger
 from core.config_loader import get_config
 from core.task_manager import get_task_manager
 from core.file_manager import get_file_manager
-from core.transcriber import WhisperXTranscriber
+from core.transcriber import get_transcriber
 
 
 router = APIRouter()
 logger = get_logger(__name__)
 
+# Statuses for which a new transcription task is queued, built once so the
+# request path does not rebuild a list of enum members on every call
+_REQUEUE_STATUSES = frozenset({TaskStatus.PENDING, TaskStatus.ERROR, None})
+
+# System metrics cache used by the health check
+CPU_SAMPLE_INTERVAL = 5.0  # seconds
+DISK_USAGE_TTL = 10.0  # seconds
+_cpu_percent: float = 0.0
+_disk_usage_cache: Dict[str, Tuple[float, Dict[str, float]]] = {}
+
+
+async def monitor_cpu_usage(interval: float = CPU_SAMPLE_INTERVAL):
+    """
+    Background loop sampling CPU usage for the health check
+
+    psutil.cpu_percent(interval=None) is non-blocking and reports usage since
+    the previous call, so sampling periodically keeps /health from sleeping.
+    """
+    global _cpu_percent
+    psutil.cpu_percent(interval=None)  # Prime the counters
+
+    while True:
+        await asyncio.sleep(interval)
+        _cpu_percent = psutil.cpu_percent(interval=None)
 
-@router.get("/health", response_model=HealthCheckResponse)
-async def health_check():
+
+def _get_disk_space(path: str) -> Dict[str, float]:
+    """
+    Get disk space for a path, cached for DISK_USAGE_TTL seconds
+
+    Args:
+        path: Directory to check
+
+    Returns:
+        Disk space dictionary in gigabytes
+    """
+    now = time.monotonic()
+    cached = _disk_usage_cache.get(path)
+    if cached and now - cached[0] < DISK_USAGE_TTL:
+        return cached[1]
+
+    disk_usage = shutil.disk_usage(path)
+    disk_space = {
+        "total_gb": disk_usage.total / (1024**3),
+        "used_gb": disk_usage.used / (1024**3),
+        "free_gb": disk_usage.free / (1024**3),
+        "free_percent": (disk_usage.free / disk_usage.total) * 100
+    }
+    _disk_usage_cache[path] = (now, disk_space)
+    return disk_space
+
+
+def _orjson_response(model: BaseModel) -> ORJSONResponse:
+    """
+    Serialize a response model with orjson, bypassing jsonable_encoder
+
+    Routes declare their models via responses= for the OpenAPI schema only;
+    without response_model FastAPI does no extra validation pass at runtime.
+    """
+    return ORJSONResponse(content=model.model_dump())
+
+
+@router.get("/health", responses={200: {"model": HealthCheckResponse}})
+async def health_check(
+    deep: bool = Query(False, description="Verify WhisperX by running it (slow)")
+):
     """
     Enhanced health check endpoint with system information
     Checks WhisperX availability, loaded models, and system resources
@@ -36,36 +104,28 @@ async def health_check():
         file_manager = get_file_manager()
 
         # Check WhisperX availability
-        transcriber = WhisperXTranscriber(config)
-        whisperx_available = await transcriber.check_availability()
+        transcriber = get_transcriber()
+        whisperx_available = await transcriber.check_availability(deep=deep)
 
         # Get loaded models
         models_loaded = await transcriber.get_available_models()
 
-        # Get system information
-        import psutil
-        import shutil
-
+        # Get system information (CPU usage is sampled in the background)
+        memory = psutil.virtual_memory()
         system_info = {
-            "cpu_percent": psutil.cpu_percent(interval=1),
-            "memory_percent": psutil.virtual_memory().percent,
-            "memory_available_gb": psutil.virtual_memory().available / (1024**3),
+            "cpu_percent": _cpu_percent,
+            "memory_percent": memory.percent,
+            "memory_available_gb": memory.available / (1024**3),
         }
 
         # Check disk space for shared directory
         shared_path = config.get("shared_directory", "./shared")
-        disk_usage = shutil.disk_usage(shared_path)
-        disk_space = {
-            "total_gb": disk_usage.total / (1024**3),
-            "used_gb": disk_usage.used / (1024**3),
-            "free_gb": disk_usage.free / (1024**3),
-            "free_percent": (disk_usage.free / disk_usage.total) * 100
-        }
+        disk_space = _get_disk_space(shared_path)
 
         # Calculate uptime (placeholder - would need app start time)
         uptime = 0.0  # Will be implemented with global app state
 
-        return HealthCheckResponse(
+        return _orjson_response(HealthCheckResponse(
             status="healthy",
             service="Audio Transcriber API",
             version="1.0.0",
@@ -74,7 +134,7 @@ async def health_check():
             models_loaded=models_loaded,
             system_info=system_info,
             disk_space=disk_space
-        )
+        ))
 
     except Exception as e:
         logger.error(f"Health check failed: {e}")
@@ -88,7 +148,7 @@ async def health_check():
         )
 
 
-@router.post("/transcribe", response_model=TranscribeResponse)
+@router.post("/transcribe", responses={200: {"model": TranscribeResponse}})
 async def transcribe_audio(request: TranscribeRequest):
     """
     Submit audio file for transcription
@@ -100,47 +160,43 @@ async def transcribe_audio(request: TranscribeRequest):
         file_manager = get_file_manager()
         task_manager = get_task_manager()
 
-        # Check file existence with 3 attempts (1 second interval)
-        file_exists = False
-        for attempt in range(3):
-            if await file_manager.file_exists(request.filename):
-                file_exists = True
-                break
-            if attempt < 2:  # Don't wait after the last attempt
-                await asyncio.sleep(1)
+        # Wait up to 3 seconds for the file to appear in the shared directory
+        file_exists = await file_manager.file_exists_wait(request.filename, timeout=3.0)
 
         if not file_exists:
-            return TranscribeResponse(
+            return _orjson_response(TranscribeResponse.model_construct(
                 status=TaskStatus.FILE_NOT_FOUND,
                 filename=request.filename,
-                message=f"File '{request.filename}' not found after 3 attempts"
-            )
+                message=f"File '{request.filename}' not found after waiting 3 seconds"
+            ))
 
         # Check current file status
         current_status = await file_manager.get_file_status(request.filename)
 
         # Implement status logic according to specification matrix
         if current_status == TaskStatus.COMPLETED:
-            return TranscribeResponse(
+            return _orjson_response(TranscribeResponse.model_construct(
                 status=TaskStatus.COMPLETED,
                 filename=request.filename,
                 message="File already processed. Use /result endpoint to get results."
-            )
+            ))
 
         elif current_status == TaskStatus.PROCESSING:
             # Get current task info
-            task_info = await task_manager.get_task_info(request.filename)
-            queue_position = await task_manager.get_queue_position(request.filename)
+            task_info, queue_position = await asyncio.gather(
+                task_manager.get_task_info(request.filename),
+                task_manager.get_queue_position(request.filename)
+            )
 
-            return TranscribeResponse(
+            return _orjson_response(TranscribeResponse.model_construct(
                 status=TaskStatus.PROCESSING,
                 filename=request.filename,
                 task_id=task_info.task_id if task_info else None,
                 message="File is currently being processed",
                 queue_position=queue_position
-            )
+            ))
 
-        elif current_status in [TaskStatus.PENDING, TaskStatus.ERROR, None]:
+        elif current_status in _REQUEUE_STATUSES:
             # Create new task with API priority
             task_id = await task_manager.add_task(
                 filename=request.filename,
@@ -148,14 +204,16 @@ async def transcribe_audio(request: TranscribeRequest):
                 transcribe_request=request
             )
 
-            queue_position = await task_manager.get_queue_position(request.filename)
-            estimated_wait = await task_manager.get_estimated_wait_time(task_id)
+            queue_position, estimated_wait = await asyncio.gather(
+                task_manager.get_queue_position(request.filename),
+                task_manager.get_estimated_wait_time(task_id)
+            )
 
             debug_info = None
             if request.debug:
                 debug_info = await file_manager.get_debug_info(request.filename)
 
-            return TranscribeResponse(
+            return _orjson_response(TranscribeResponse.model_construct(
                 status=TaskStatus.PENDING,
                 filename=request.filename,
                 task_id=task_id,
@@ -163,14 +221,84 @@ async def transcribe_audio(request: TranscribeRequest):
                 queue_position=queue_position,
                 estimated_wait_time=estimated_wait,
                 debug_info=debug_info
-            )
+            ))
 
     except Exception as e:
         logger.error(f"Error processing transcribe request: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.delete("/transcribe", response_model=DeleteResponse)
+@router.post("/transcribe/batch", responses={200: {"model": BatchTranscribeResponse}})
+async def transcribe_audio_batch(batch: BatchTranscribeRequest):
+    """
+    Submit several audio files for transcription in one request
+    File checks run concurrently and all new tasks are queued at once
+    """
+    try:
+        logger.info(f"Received batch transcription request for {len(batch.items)} files")
+
+        file_manager = get_file_manager()
+        task_manager = get_task_manager()
+
+        # Later duplicates of the same filename override earlier ones
+        requests = list({item.filename: item for item in batch.items}.values())
+
+        exists = await asyncio.gather(
+            *[file_manager.file_exists(r.filename) for r in requests]
+        )
+        existing = [r for r, found in zip(requests, exists) if found]
+        statuses = await asyncio.gather(
+            *[file_manager.get_file_status(r.filename) for r in existing]
+        )
+        status_by_name = {r.filename: status for r, status in zip(existing, statuses)}
+
+        to_queue = [r for r in existing if status_by_name[r.filename] in _REQUEUE_STATUSES]
+        task_ids = await task_manager.add_tasks(
+            [(r.filename, r) for r in to_queue],
+            priority=TaskPriority.API
+        )
+        task_id_by_name = {r.filename: task_id for r, task_id in zip(to_queue, task_ids)}
+
+        items = []
+        for r in requests:
+            if r.filename not in status_by_name:
+                items.append(TranscribeResponse.model_construct(
+                    status=TaskStatus.FILE_NOT_FOUND,
+                    filename=r.filename,
+                    message=f"File '{r.filename}' not found"
+                ))
+            elif r.filename in task_id_by_name:
+                items.append(TranscribeResponse.model_construct(
+                    status=TaskStatus.PENDING,
+                    filename=r.filename,
+                    task_id=task_id_by_name[r.filename],
+                    message="Task added to processing queue"
+                ))
+            elif status_by_name[r.filename] == TaskStatus.COMPLETED:
+                items.append(TranscribeResponse.model_construct(
+                    status=TaskStatus.COMPLETED,
+                    filename=r.filename,
+                    message="File already processed. Use /result endpoint to get results."
+                ))
+            else:
+                items.append(TranscribeResponse.model_construct(
+                    status=TaskStatus.PROCESSING,
+                    filename=r.filename,
+                    message="File is currently being processed"
+                ))
+
+        return _orjson_response(BatchTranscribeResponse.model_construct(
+            status="success",
+            queued=len(task_ids),
+            items=items
+        ))
+
+    except Exception as e:
+        logger.error(f"Error processing batch transcribe request: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.delete("/transcribe", responses={200: {"model": DeleteResponse}})
 async def delete_transcription(request: DeleteRequest):
     """
     Delete transcription files immediately (priority 0)
@@ -194,19 +322,19 @@ async def delete_transcription(request: DeleteRequest):
             force=request.force
         )
 
-        return DeleteResponse(
+        return _orjson_response(DeleteResponse(
             status="success",
             filename=request.filename,
             message=f"Successfully deleted {len(deleted_files)} files",
             files_deleted=deleted_files
-        )
+        ))
 
     except Exception as e:
         logger.error(f"Error processing delete request: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.get("/status/{filename}", response_model=StatusResponse)
+@router.get("/status/{filename}", responses={200: {"model": StatusResponse}})
 async def get_transcription_status(
     filename: str,
     debug: bool = Query(False, description="Enable debug mode")
@@ -223,12 +351,15 @@ async def get_transcription_status(
         # Get current status
         status = await file_manager.get_file_status(filename)
 
+        # Response models below are built from task/file manager state that
+        # was validated when it was stored, so model_construct skips a second
+        # validation pass. Client input (TranscribeRequest) is still validated.
         if status is None:
-            return StatusResponse(
+            return _orjson_response(StatusResponse.model_construct(
                 status=TaskStatus.FILE_NOT_FOUND,
                 filename=filename,
                 message="No processing information found for this file"
-            )
+            ))
 
         # Get additional information based on status
         queue_position = None
@@ -239,10 +370,13 @@ async def get_transcription_status(
 
         if status == TaskStatus.PENDING:
             # Get task info for priority and queue position
-            task_info = await task_manager.get_task_info(filename)
+            task_info, queue_position = await asyncio.gather(
+                task_manager.get_task_info(filename),
+                task_manager.get_queue_position(filename)
+            )
             if task_info:
-                priority = task_info.priority.value
-                queue_position = await task_manager.get_queue_position(filename)
+                priority = task_info.priority.name
+                # Depends on task_id, so it cannot join the gather above
                 estimated_completion = await task_manager.get_estimated_completion_time(task_info.task_id)
 
         elif status == TaskStatus.PROCESSING:
@@ -259,7 +393,7 @@ async def get_transcription_status(
         if debug:
             debug_info = await file_manager.get_debug_info(filename)
 
-        return StatusResponse(
+        return _orjson_response(StatusResponse.model_construct(
             status=status,
             filename=filename,
             message=f"File status: {status.value}",
@@ -268,14 +402,14 @@ async def get_transcription_status(
             estimated_completion=estimated_completion,
             processing_time=processing_time,
             debug_info=debug_info
-        )
+        ))
 
     except Exception as e:
         logger.error(f"Error getting status for {filename}: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.get("/result/{filename}", response_model=ResultResponse)
+@router.get("/result/{filename}", responses={200: {"model": ResultResponse}})
 async def get_transcription_result(filename: str):
     """
     Get transcription result for a completed file
@@ -285,23 +419,30 @@ async def get_transcription_result(filename: str):
 
         file_manager = get_file_manager()
 
+        not_found = ResultResponse.model_construct(
+            status="not_found",
+            filename=filename,
+            message="No result found for this file"
+        )
+
         # Check if result exists
         if not await file_manager.result_exists(filename):
-            return ResultResponse(
-                status="not_found",
-                filename=filename,
-                message="No result found for this file"
-            )
+            return _orjson_response(not_found)
 
-        # Get the result
+        # Get the result. The .result file was written from a validated
+        # TranscriptionResult, so its dict is serialized as-is instead of
+        # building a model per segment (long audio has thousands of them).
         result = await file_manager.get_result(filename)
+        if result is None:
+            # Deleted after the existence check
+            return _orjson_response(not_found)
 
-        return ResultResponse(
-            status="success",
-            filename=filename,
-            result=result,
-            message="Result retrieved successfully"
-        )
+        return ORJSONResponse(content={
+            "status": "success",
+            "filename": filename,
+            "result": result,
+            "message": "Result retrieved successfully"
+        })
 
     except Exception as e:
         logger.error(f"Error getting result for {filename}: {e}")
@@ -319,12 +460,12 @@ async def get_queue_status():
         task_manager = get_task_manager()
         queue_info = await task_manager.get_queue_info()
 
-        return {
+        return ORJSONResponse(content={
             "status": "success",
             "queue_length": queue_info.get("length", 0),
             "processing_count": queue_info.get("processing", 0),
             "tasks": queue_info.get("tasks", [])
-        }
+        })
 
     except Exception as e:
         logger.error(f"Error getting queue status: {e}")
@@ -337,8 +478,7 @@ async def get_available_models():
     Get list of available WhisperX models
     """
     try:
-        config = get_config()
-        transcriber = WhisperXTranscriber(config)
+        transcriber = get_transcriber()
         models = await transcriber.get_available_models()
 
         return {
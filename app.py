@@ -5,30 +5,41 @@ Main entry point for the WhisperX-based transcription API
 
 import asyncio
 import logging
+import os
+import sys
 from contextlib import asynccontextmanager
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 
-from api.routes import router as api_router
-from core.logger import setup_logger
-from core.config_loader import load_config
-from core.task_manager import TaskManager
-from core.file_manager import FileManager
+from api.routes import router as api_router, monitor_cpu_usage
+from core.logger import init_default_logger, setup_logger, stop_logging
+from core.config_loader import get_config
+from core.task_manager import get_task_manager
+from core.file_manager import get_file_manager
+from core.transcriber import get_transcriber
 
 
+# Configure application logging once, before any startup messages
+init_default_logger()
+
 # Global instances
 task_manager = None
 file_manager = None
+transcriber = None
 config = None
 
+# Background tasks started at startup, kept referenced so they are not
+# garbage collected and cancelled at shutdown
+background_tasks = []
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """
     Application lifespan manager for startup and shutdown events
     """
-    global task_manager, file_manager, config
+    global task_manager, file_manager, transcriber, config
 
     # Startup
     logger = logging.getLogger(__name__)
@@ -36,16 +47,21 @@ async def lifespan(app: FastAPI):
 
     try:
         # Load configuration
-        config = load_config()
+        config = get_config()
         logger.info("Configuration loaded successfully")
 
-        # Initialize managers
-        task_manager = TaskManager(config)
-        file_manager = FileManager(config)
+        # Initialize the shared instances used by the API routes
+        task_manager = get_task_manager()
+        file_manager = get_file_manager()
+        transcriber = get_transcriber()
 
         # Start background tasks
-        asyncio.create_task(task_manager.start_processing())
-        asyncio.create_task(file_manager.start_monitoring())
+        background_tasks.extend([
+            asyncio.create_task(task_manager.start_processing()),
+            asyncio.create_task(file_manager.start_monitoring()),
+            asyncio.create_task(monitor_cpu_usage()),
+            asyncio.create_task(transcriber.warm_up())
+        ])
 
         logger.info("Audio Transcriber API started successfully")
 
@@ -63,7 +79,17 @@ async def lifespan(app: FastAPI):
     if file_manager:
         await file_manager.stop()
 
+    # The CPU monitor never returns and warm-up may still be using the workers
+    for task in background_tasks:
+        task.cancel()
+    await asyncio.gather(*background_tasks, return_exceptions=True)
+    background_tasks.clear()
+
+    if transcriber:
+        await transcriber.close()
+
     logger.info("Audio Transcriber API shutdown complete")
+    stop_logging()
 
 
 # Create FastAPI application
@@ -73,6 +99,7 @@ app = FastAPI(
     version="1.0.0",
     docs_url="/docs",
     redoc_url="/redoc",
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
@@ -91,7 +118,7 @@ async def http_exception_handler(request, exc):
     """
     Global HTTP exception handler
     """
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
         content={"detail": exc.detail, "status": "error"}
     )
@@ -105,7 +132,7 @@ async def general_exception_handler(request, exc):
     logger = logging.getLogger(__name__)
     logger.error(f"Unhandled exception: {exc}", exc_info=True)
 
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content={"detail": "Internal server error", "status": "error"}
     )
@@ -148,11 +175,21 @@ if __name__ == "__main__":
     # Setup logging
     setup_logger()
 
-    # Run the application
+    # Auto-reload only for local development (DEV=1), it forks a file watcher
+    dev_mode = os.getenv("DEV", "").lower() in ("1", "true", "yes", "on")
+
+    # uvloop/httptools ship with uvicorn[standard] but uvloop has no Windows build
+    fast_io = sys.platform != "win32"
+
+    # Run the application. Tasks are queued in process memory, so multiple
+    # workers would each scan and transcribe the same shared directory.
     uvicorn.run(
         "app:app",
         host="0.0.0.0",
         port=8000,
-        reload=True,  # Set to False in production
+        loop="uvloop" if fast_io else "asyncio",
+        http="httptools" if fast_io else "h11",
+        reload=dev_mode,
+        workers=1,
         log_level="info"
     )
@@ -5,13 +5,73 @@ Loads and validates configuration from YAML files
 
 import os
 import yaml
-import logging
 from pathlib import Path
-from typing import Dict, Any, Optional
+from collections import OrderedDict
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Optional, Set, Tuple
 
 from core.logger import get_logger
 
 
+# Use the libyaml C parser when PyYAML was built with it
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Parsed YAML files keyed by resolved path, invalidated by mtime and size
+_FILE_CACHE_SIZE = 8
+_file_cache: "OrderedDict[str, Tuple[int, int, Mapping[str, Any]]]" = OrderedDict()
+
+
+def _read_config_file(config_file: Path) -> Mapping[str, Any]:
+    """
+    Parse a YAML config file, reusing the previous parse if it is unchanged
+
+    The cached mapping is shared between callers and exposed read-only;
+    _merge_configs copies what it takes from it.
+
+    Args:
+        config_file: Path to existing config file
+
+    Returns:
+        Parsed configuration mapping (read-only)
+    """
+    key = str(config_file.resolve())
+    stat = config_file.stat()
+
+    cached = _file_cache.get(key)
+    if cached is not None and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+        _file_cache.move_to_end(key)
+        return cached[2]
+
+    # libyaml decodes the bytes itself, no need for a Python text wrapper
+    with open(config_file, 'rb') as f:
+        file_config = MappingProxyType(yaml.load(f, Loader=_YamlLoader) or {})
+
+    _file_cache[key] = (stat.st_mtime_ns, stat.st_size, file_config)
+    _file_cache.move_to_end(key)
+    while len(_file_cache) > _FILE_CACHE_SIZE:
+        _file_cache.popitem(last=False)
+    return file_config
+
+
+# Directories already created (or found) by ensure_directory in this process
+_ensured_dirs: Set[str] = set()
+
+
+def ensure_directory(path) -> None:
+    """
+    Create a directory and its parents, at most once per process
+
+    Args:
+        path: Directory path (str or Path)
+    """
+    key = os.path.abspath(path)
+    if key in _ensured_dirs:
+        return
+
+    os.makedirs(key, exist_ok=True)
+    _ensured_dirs.add(key)
+
+
 def load_config(config_path: Optional[str] = None) -> Dict[str, Any]:
     """
     Load configuration from YAML file
@@ -35,7 +95,9 @@ def load_config(config_path: Optional[str] = None) -> Dict[str, Any]:
         "model_directory": "./models",
         "temp_directory": "./temp",
         "processing_timeout": 600,  # 10 minutes
+        "timeout_per_audio_second": 0.5,
         "max_retries": 3,
+        "max_completed_history": 1000,
         "log_level": "INFO",
         "api": {
             "host": "0.0.0.0",
@@ -44,10 +106,12 @@ def load_config(config_path: Optional[str] = None) -> Dict[str, Any]:
         },
         "whisperx": {
             "default_model": "small",
-            "default_compute_type": "float32",
+            "default_compute_type": None,  # int8 on CPU, int8_float16 on GPU
             "default_language": None,
-            "batch_size": 16,
-            "device": "cpu"
+            "batch_size": None,  # Half the available CPUs, at most 32
+            "threads": None,  # All available CPUs
+            "device": "cpu",
+            "backend": "subprocess"
         },
         "monitoring": {
             "enabled": True,
@@ -59,8 +123,7 @@ def load_config(config_path: Optional[str] = None) -> Dict[str, Any]:
         if config_file.exists():
             logger.info(f"Loading configuration from {config_file}")
 
-            with open(config_file, 'r', encoding='utf-8') as f:
-                file_config = yaml.safe_load(f) or {}
+            file_config = _read_config_file(config_file)
 
             # Merge with defaults (file config takes precedence)
             config = _merge_configs(default_config, file_config)
@@ -84,9 +147,12 @@ def load_config(config_path: Optional[str] = None) -> Dict[str, Any]:
         return default_config
 
 
-def _merge_configs(default: Dict[str, Any], override: Dict[str, Any]) -> Dict[str, Any]:
+def _merge_configs(default: Dict[str, Any], override: Mapping[str, Any]) -> Dict[str, Any]:
     """
-    Recursively merge configuration dictionaries
+    Merge configuration dictionaries, recursing into nested dictionaries
+
+    Nested dictionaries are copied rather than shared, so the result can be
+    modified without touching either input.
 
     Args:
         default: Default configuration
@@ -96,16 +162,56 @@ def _merge_configs(default: Dict[str, Any], override: Dict[str, Any]) -> Dict[st
         Merged configuration
     """
     result = default.copy()
-
-    for key, value in override.items():
-        if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-            result[key] = _merge_configs(result[key], value)
-        else:
-            result[key] = value
+    stack = [(result, override)]
+
+    while stack:
+        target, source = stack.pop()
+        for key, value in source.items():
+            if isinstance(value, dict):
+                current = target.get(key)
+                merged = current.copy() if isinstance(current, dict) else {}
+                target[key] = merged
+                stack.append((merged, value))
+            else:
+                target[key] = value
 
     return result
 
 
+# Allowed values checked by _validate_config
+_VALID_MODELS = ("tiny", "base", "small", "medium", "large")
+_VALID_COMPUTE_TYPES = ("float16", "float32", "int8", "int8_float16")
+_VALID_DEVICES = ("cpu", "cuda", "auto")
+_VALID_BACKENDS = ("subprocess", "worker", "in_process")
+
+
+def _parse_bool(value: str) -> bool:
+    """Parse a boolean environment variable value"""
+    return value.lower() in ('true', '1', 'yes', 'on')
+
+
+# Environment variable overrides: (env var, config path, converter)
+_ENV_RULES = [
+    ("SHARED_DIRECTORY", ("shared_directory",), str),
+    ("MODEL_DIRECTORY", ("model_directory",), str),
+    ("TEMP_DIRECTORY", ("temp_directory",), str),
+    ("PROCESSING_TIMEOUT", ("processing_timeout",), int),
+    ("TIMEOUT_PER_AUDIO_SECOND", ("timeout_per_audio_second",), float),
+    ("MAX_RETRIES", ("max_retries",), int),
+    ("MAX_COMPLETED_HISTORY", ("max_completed_history",), int),
+    ("LOG_LEVEL", ("log_level",), str),
+    ("API_HOST", ("api", "host"), str),
+    ("API_PORT", ("api", "port"), int),
+    ("API_DEBUG", ("api", "debug"), _parse_bool),
+    ("WHISPERX_DEFAULT_MODEL", ("whisperx", "default_model"), str),
+    ("WHISPERX_BATCH_SIZE", ("whisperx", "batch_size"), int),
+    ("WHISPERX_THREADS", ("whisperx", "threads"), int),
+    ("WHISPERX_DEVICE", ("whisperx", "device"), str),
+    ("WHISPERX_BACKEND", ("whisperx", "backend"), str),
+    ("MONITORING_ENABLED", ("monitoring", "enabled"), _parse_bool),
+]
+
+
 def _apply_env_overrides(config: Dict[str, Any]) -> Dict[str, Any]:
     """
     Apply environment variable overrides to configuration
@@ -116,44 +222,21 @@ def _apply_env_overrides(config: Dict[str, Any]) -> Dict[str, Any]:
     Returns:
         Configuration with environment overrides
     """
-    # Environment variable mappings
-    env_mappings = {
-        "SHARED_DIRECTORY": ("shared_directory",),
-        "MODEL_DIRECTORY": ("model_directory",),
-        "TEMP_DIRECTORY": ("temp_directory",),
-        "PROCESSING_TIMEOUT": ("processing_timeout", int),
-        "MAX_RETRIES": ("max_retries", int),
-        "LOG_LEVEL": ("log_level",),
-        "API_HOST": ("api", "host"),
-        "API_PORT": ("api", "port", int),
-        "API_DEBUG": ("api", "debug", bool),
-        "WHISPERX_DEFAULT_MODEL": ("whisperx", "default_model"),
-        "WHISPERX_DEVICE": ("whisperx", "device"),
-        "MONITORING_ENABLED": ("monitoring", "enabled", bool),
-    }
-
-    for env_var, path in env_mappings.items():
+    for env_var, path, converter in _ENV_RULES:
         env_value = os.getenv(env_var)
-        if env_value is not None:
-            # Apply type conversion if specified
-            if len(path) > 1 and callable(path[-1]):
-                converter = path[-1]
-                path = path[:-1]
-                try:
-                    if converter == bool:
-                        env_value = env_value.lower() in ('true', '1', 'yes', 'on')
-                    else:
-                        env_value = converter(env_value)
-                except (ValueError, TypeError):
-                    continue
-
-            # Set the value in config
-            current = config
-            for key in path[:-1]:
-                if key not in current:
-                    current[key] = {}
-                current = current[key]
-            current[path[-1]] = env_value
+        if env_value is None:
+            continue
+
+        try:
+            value = converter(env_value)
+        except (ValueError, TypeError):
+            continue
+
+        # Set the value in config
+        current = config
+        for key in path[:-1]:
+            current = current.setdefault(key, {})
+        current[path[-1]] = value
 
     return config
 
@@ -178,9 +261,15 @@ def _validate_config(config: Dict[str, Any]) -> None:
     if config.get("processing_timeout", 0) <= 0:
         raise ValueError("processing_timeout must be positive")
 
+    if config.get("timeout_per_audio_second", 0) < 0:
+        raise ValueError("timeout_per_audio_second must be non-negative")
+
     if config.get("max_retries", 0) < 0:
         raise ValueError("max_retries must be non-negative")
 
+    if config.get("max_completed_history", 1) <= 0:
+        raise ValueError("max_completed_history must be positive")
+
     # Validate API configuration
     api_config = config.get("api", {})
     port = api_config.get("port", 8000)
@@ -189,15 +278,29 @@ def _validate_config(config: Dict[str, Any]) -> None:
 
     # Validate WhisperX configuration
     whisperx_config = config.get("whisperx", {})
-    valid_models = ["tiny", "base", "small", "medium", "large"]
     default_model = whisperx_config.get("default_model", "small")
-    if default_model not in valid_models:
-        raise ValueError(f"default_model must be one of: {valid_models}")
+    if default_model not in _VALID_MODELS:
+        raise ValueError(f"default_model must be one of: {_VALID_MODELS}")
+
+    compute_type = whisperx_config.get("default_compute_type")
+    if compute_type is not None and compute_type not in _VALID_COMPUTE_TYPES:
+        raise ValueError(f"default_compute_type must be one of: {_VALID_COMPUTE_TYPES}")
+
+    batch_size = whisperx_config.get("batch_size")
+    if batch_size is not None and batch_size <= 0:
+        raise ValueError("batch_size must be positive")
+
+    threads = whisperx_config.get("threads")
+    if threads is not None and threads <= 0:
+        raise ValueError("threads must be positive")
+
+    device = whisperx_config.get("device", "cpu")
+    if device not in _VALID_DEVICES:
+        raise ValueError(f"device must be one of: {_VALID_DEVICES}")
 
-    valid_compute_types = ["float16", "float32", "int8"]
-    compute_type = whisperx_config.get("default_compute_type", "float32")
-    if compute_type not in valid_compute_types:
-        raise ValueError(f"default_compute_type must be one of: {valid_compute_types}")
+    backend = whisperx_config.get("backend", "subprocess")
+    if backend not in _VALID_BACKENDS:
+        raise ValueError(f"backend must be one of: {_VALID_BACKENDS}")
 
 
 def save_config(config: Dict[str, Any], config_path: Optional[str] = None) -> None:
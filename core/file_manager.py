@@ -5,20 +5,188 @@ Handles file monitoring, result management, and file operations
 
 import asyncio
 import json
-import logging
 import os
-import shutil
+import tempfile
+import time
+from collections import OrderedDict, defaultdict
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Any
-from watchdog.events import FileSystemEventHandler
+from stat import S_ISREG
+from typing import Dict, List, Optional, Any, Tuple
+from watchdog.events import PatternMatchingEventHandler
 from watchdog.observers import Observer
 from dataclasses import dataclass
+from functools import lru_cache
+from operator import itemgetter
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is listed in requirements.txt
+    orjson = None
+
+from core.logger import get_logger
 
 # Import TaskStatus locally in functions to avoid circular imports
 
+# Supported audio formats
+_AUDIO_EXTS = frozenset({
+    '.mp3', '.wav', '.flac', '.m4a', '.ogg', '.wma',
+    '.aac', '.opus', '.mp4', '.avi', '.mov', '.mkv'
+})
+
+# Files with this token in the name are never queued automatically
+_SKIP_TOKEN = "sample"
+
+
+# Maximum number of parsed status files kept in memory
+_STATUS_CACHE_SIZE = 1024
+
+# Maximum number of watcher notifications turned into one add_tasks call
+_NEW_FILE_BATCH = 64
+
+# Maximum number of files whose shared directory paths are kept
+_FILE_SLOTS_SIZE = 4096
+
+# Files this process writes into the shared directory itself
+_IGNORED_PATTERNS = ["*.in_progress", "*.result", "*.tmp"]
+
+# Seconds queued status updates wait before being written, coalescing
+# several updates of the same file into one write
+_STATUS_FLUSH_DELAY = 0.05
+
+
+def _is_audio_name(name: str) -> bool:
+    """Check a file name against _AUDIO_EXTS without building a Path"""
+    dot = name.rfind('.')
+    return dot > 0 and name[dot:].lower() in _AUDIO_EXTS
+
+
+if orjson is not None:
+    _json_loads = orjson.loads
+
+    def _json_dumps(data: Any) -> bytes:
+        """Serialize data to indented UTF-8 JSON bytes"""
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+else:
+    _json_loads = json.loads
+
+    def _json_dumps(data: Any) -> bytes:
+        """Serialize data to indented UTF-8 JSON bytes"""
+        return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+@lru_cache(maxsize=4096)
+def _stem(filename: str) -> str:
+    """
+    Strip the extension from a bare file name
+
+    Same result as Path(filename).stem for the plain names used in the
+    shared directory, without building a Path on every status call.
+
+    Args:
+        filename: File name without directory part
+
+    Returns:
+        Name without its last extension
+    """
+    base_name = filename.rpartition('.')[0]
+    return base_name or filename
+
+
+def _read_json(path: str) -> Optional[Any]:
+    """
+    Parse a JSON file without a separate existence check
+
+    Args:
+        path: Path to the JSON file
+
+    Returns:
+        Parsed data or None if the file does not exist
+    """
+    try:
+        with open(path, 'rb') as f:
+            return _json_loads(f.read())
+    except FileNotFoundError:
+        return None
+
+
+def _write_atomic(path: str, data: bytes):
+    """
+    Replace a file's contents so readers never see a partial write
+
+    The data goes to a uniquely named sibling .tmp file (ignored by the
+    watcher) which is then renamed over the target, so concurrent writers of
+    the same file never share a temporary file. No fsync: status and result
+    files can be rebuilt from the audio file if a crash loses them.
+
+    Args:
+        path: Target file path
+        data: Complete file contents
+    """
+    directory, name = os.path.split(path)
+    fd, tmp_path = tempfile.mkstemp(prefix=f"{name}.", suffix=".tmp", dir=directory or ".")
+    try:
+        try:
+            os.fchmod(fd, 0o644)
+            # os.write may write less than asked (e.g. when the disk fills up)
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except FileNotFoundError:
+            pass
+        raise
+
+
+def _datetime_to_ns(value: datetime) -> int:
+    """Convert a datetime to integer nanoseconds since the epoch"""
+    return int(value.timestamp()) * 1_000_000_000 + value.microsecond * 1000
+
+
+def _result_timestamp(data: Dict[str, Any], iso_timestamp: str) -> datetime:
+    """
+    Get the completion time of a parsed .result file
+
+    Args:
+        data: Parsed .result data
+        iso_timestamp: Its ISO 8601 "timestamp" field
+
+    Returns:
+        Timestamp from "timestamp_ns" when present, else parsed from ISO format
+    """
+    timestamp_ns = data.get("timestamp_ns")
+    if timestamp_ns is None:
+        return datetime.fromisoformat(iso_timestamp)
+
+    seconds, remainder = divmod(timestamp_ns, 1_000_000_000)
+    return datetime.fromtimestamp(seconds).replace(microsecond=remainder // 1000)
+
+
+def _result_info_view(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Project parsed .result data down to the basic info fields"""
+    return {
+        "processing_time": data.get("processing_time"),
+        "word_count": data.get("word_count"),
+        "duration": data.get("duration"),
+        "model_used": data.get("model_used"),
+        "timestamp": data.get("timestamp")
+    }
+
+
+@dataclass(slots=True)
+class _FileSlots:
+    """Paths of an audio file and its status files in the shared directory"""
+    original: str
+    in_progress: str
+    result: str
+
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TranscriptionResult:
     """Dataclass for transcription results"""
     filename: str
@@ -32,9 +200,40 @@ class TranscriptionResult:
     file_size: int
 
 
+# Keys read from a .result file by load_result
+_RESULT_FIELDS = itemgetter(
+    "filename", "text", "status", "model_used", "language",
+    "confidence", "duration", "file_size", "timestamp"
+)
+
+
 class FileManagerMixin:
     """Mixin class providing file management functionality"""
-    
+
+    def _file_paths(self, filename: str) -> _FileSlots:
+        """
+        Get the shared directory paths for a file, building them on first use
+
+        Args:
+            filename: Name of the audio file
+
+        Returns:
+            Precomputed original, .in_progress and .result paths
+        """
+        slots = self._file_slots.get(filename)
+        if slots is None:
+            base_path = os.path.join(self._shared_str, _stem(filename))
+            slots = _FileSlots(
+                original=os.path.join(self._shared_str, filename),
+                in_progress=base_path + ".in_progress",
+                result=base_path + ".result"
+            )
+            if len(self._file_slots) >= _FILE_SLOTS_SIZE:
+                # Drop the oldest entry, dicts keep insertion order
+                del self._file_slots[next(iter(self._file_slots))]
+            self._file_slots[filename] = slots
+        return slots
+
     async def load_result(self, filename: str) -> Optional[TranscriptionResult]:
         """
         Load transcription result from .result file
@@ -46,25 +245,26 @@ class FileManagerMixin:
             TranscriptionResult object or None if not found
         """
         try:
-            base_name = Path(filename).stem
-            result_file = self.shared_directory / f"{base_name}.result"
-            
-            if not result_file.exists():
+            result_file = self._file_paths(filename).result
+
+            data = await asyncio.to_thread(_read_json, result_file)
+            if data is None:
                 return None
 
-            with open(result_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            # One C-level pass over the keys; a missing key raises KeyError
+            (filename_, text, status, model_used, language,
+             confidence, duration, file_size, timestamp) = _RESULT_FIELDS(data)
 
             result = TranscriptionResult(
-                filename=data["filename"],
-                text=data["text"], 
-                status=data["status"],
-                model_used=data["model_used"],
-                language=data["language"],
-                confidence=data["confidence"],
-                duration=data["duration"],
-                file_size=data["file_size"],
-                timestamp=datetime.fromisoformat(data["timestamp"])
+                filename=filename_,
+                text=text,
+                status=status,
+                model_used=model_used,
+                language=language,
+                confidence=confidence,
+                duration=duration,
+                file_size=file_size,
+                timestamp=_result_timestamp(data, timestamp)
             )
 
             return result
@@ -73,6 +273,47 @@ class FileManagerMixin:
             self.logger.error(f"Error loading result for '{filename}': {e}")
             return None
 
+    async def get_result(self, filename: str) -> Optional[Dict[str, Any]]:
+        """
+        Load raw transcription result data from .result file
+
+        Args:
+            filename: Name of the audio file
+
+        Returns:
+            Result dictionary as written by the task manager, without internal
+            fields such as "timestamp_ns", or None if not found
+        """
+        result_file = self._file_paths(filename).result
+
+        try:
+            data = await asyncio.to_thread(_read_json, result_file)
+            if data is None:
+                return None
+            # Served to API clients as-is, so drop what is not in ResultResponse
+            data.pop("timestamp_ns", None)
+            return data
+        except Exception as e:
+            self.logger.error(f"Error reading result for '{filename}': {e}")
+            return None
+
+    async def save_result(self, filename: str, result) -> None:
+        """
+        Save a transcription result to the .result file
+
+        Args:
+            filename: Name of the audio file
+            result: Transcription result model from the transcriber
+        """
+        result_file = self._file_paths(filename).result
+
+        data = result.model_dump(mode="json")
+        # Integer copy of the timestamp so load_result can skip ISO parsing
+        data["timestamp_ns"] = _datetime_to_ns(result.timestamp)
+
+        await asyncio.to_thread(_write_atomic, result_file, _json_dumps(data))
+        self.logger.debug(f"Saved result for '{filename}' to {result_file}")
+
     async def result_exists(self, filename: str) -> bool:
         """
         Check if result file exists for a given filename
@@ -83,9 +324,7 @@ class FileManagerMixin:
         Returns:
             True if result file exists
         """
-        base_name = Path(filename).stem
-        result_file = self.shared_directory / f"{base_name}.result"
-        return result_file.exists()
+        return os.path.exists(self._file_paths(filename).result)
 
     async def delete_all_related_files(
         self,
@@ -102,11 +341,10 @@ class FileManagerMixin:
         Returns:
             List of deleted file paths
         """
-        base_name = Path(filename).stem
-        deleted_files = []
+        base_name = _stem(filename)
 
         # Files to delete: original, .in_progress, .result, and any temporary files
-        patterns = [
+        targets = frozenset({
             filename,  # Original file
             f"{base_name}.in_progress",
             f"{base_name}.result",
@@ -114,21 +352,45 @@ class FileManagerMixin:
             f"{base_name}.json",
             f"{base_name}.srt",
             f"{base_name}.vtt"
-        ]
+        })
 
-        for pattern in patterns:
-            file_path = self.shared_directory / pattern
-            if file_path.exists():
-                try:
-                    file_path.unlink()
-                    deleted_files.append(str(file_path))
-                    self.logger.info(f"Deleted file: {file_path}")
-                except Exception as e:
-                    self.logger.error(f"Error deleting {file_path}: {e}")
+        # Drop queued status updates and let an in-flight flush land first,
+        # so no .in_progress file is written back after the deletion
+        self._status_pending.pop(filename, None)
+        async with self._status_write_lock:
+            deleted_files = await asyncio.to_thread(self._unlink_matching, targets)
 
         # Clear from cache
-        if filename in self._status_cache:
-            del self._status_cache[filename]
+        self._status_cache.pop(filename, None)
+        self._file_slots.pop(filename, None)
+
+        return deleted_files
+
+    def _unlink_matching(self, targets: frozenset) -> List[str]:
+        """
+        Delete shared directory entries whose names are in targets (blocking)
+
+        Args:
+            targets: File names to delete
+
+        Returns:
+            List of deleted file paths
+        """
+        deleted_files = []
+
+        # One directory pass instead of a stat per candidate name
+        with os.scandir(self.shared_directory) as entries:
+            for entry in entries:
+                if entry.name not in targets:
+                    continue
+                try:
+                    os.unlink(entry.path)
+                    deleted_files.append(entry.path)
+                    self.logger.info(f"Deleted file: {entry.path}")
+                except FileNotFoundError:
+                    pass
+                except Exception as e:
+                    self.logger.error(f"Error deleting {entry.path}: {e}")
 
         return deleted_files
 
@@ -142,15 +404,15 @@ class FileManagerMixin:
         Returns:
             Processing info dictionary or None
         """
-        base_name = Path(filename).stem
-        in_progress_file = self.shared_directory / f"{base_name}.in_progress"
+        # A queued status update is newer than the file on disk
+        pending = self._status_pending.get(filename)
+        if pending is not None:
+            return dict(pending)
 
-        if not in_progress_file.exists():
-            return None
+        in_progress_file = self._file_paths(filename).in_progress
 
         try:
-            with open(in_progress_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            return await asyncio.to_thread(_read_json, in_progress_file)
         except Exception as e:
             self.logger.error(f"Error reading processing info for '{filename}': {e}")
             return None
@@ -165,144 +427,118 @@ class FileManagerMixin:
         Returns:
             Result info dictionary or None
         """
-        base_name = Path(filename).stem
-        result_file = self.shared_directory / f"{base_name}.result"
-
-        if not result_file.exists():
-            return None
+        result_file = self._file_paths(filename).result
 
         try:
-            with open(result_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = await asyncio.to_thread(_read_json, result_file)
 
             # Return basic info only
-            return {
-                "processing_time": data.get("processing_time"),
-                "word_count": data.get("word_count"),
-                "duration": data.get("duration"),
-                "model_used": data.get("model_used"),
-                "timestamp": data.get("timestamp")
-            }
+            return _result_info_view(data) if data is not None else None
 
         except Exception as e:
             self.logger.error(f"Error reading result info for '{filename}': {e}")
             return None
 
-    async def get_debug_info(self, filename: str) -> Optional[Dict[str, Any]]:
-        """
-        Get debug information for a file
-
-        Args:
-            filename: Name of the audio file
-
-        Returns:
-            Debug info dictionary or None
-        """
-        debug_info = {}
-
-        # File existence
-        debug_info["file_exists"] = await self.file_exists(filename)
 
-        # File size
-        if debug_info["file_exists"]:
-            file_path = self.shared_directory / filename
-            debug_info["file_size"] = file_path.stat().st_size
-            debug_info["file_modified"] = datetime.fromtimestamp(
-                file_path.stat().st_mtime
-            ).isoformat()
-
-        # Status file content
-        processing_info = await self.get_processing_info(filename)
-        if processing_info:
-            debug_info["processing_info"] = processing_info
-
-        # Result file info
-        result_info = await self.get_result_info(filename)
-        if result_info:
-            debug_info["result_info"] = result_info
-
-        return debug_info if debug_info else None
-
-
-class AudioFileHandler(FileSystemEventHandler):
+class AudioFileHandler(PatternMatchingEventHandler):
     """
     File system event handler for monitoring new audio files
+
+    Status and temporary files written by this process live next to the
+    audio files, so they are filtered out before any callback runs.
     """
 
+    logger = get_logger(__name__)
+
     def __init__(self, file_manager):
+        super().__init__(
+            ignore_patterns=_IGNORED_PATTERNS,
+            ignore_directories=True,
+            case_sensitive=False
+        )
         self.file_manager = file_manager
-        from core.logger import get_logger
-        self.logger = get_logger(__name__)
-
-        # Supported audio formats
-        self.audio_extensions = {
-            '.mp3', '.wav', '.flac', '.m4a', '.ogg', '.wma',
-            '.aac', '.opus', '.mp4', '.avi', '.mov', '.mkv'
-        }
 
     def on_created(self, event):
         """Handle new file creation"""
         if event.is_directory:
             return
 
-        file_path = Path(event.src_path)
-        if file_path.suffix.lower() in self.audio_extensions:
+        name = os.path.basename(event.src_path)
+        self.file_manager.notify_file_available(name)
+
+        if _is_audio_name(name):
             # Skip files with "sample" in the name (case-insensitive)
-            if "sample" in file_path.name.lower():
-                self.logger.debug(f"Skipping sample file: {file_path.name}")
+            if _SKIP_TOKEN in name.casefold():
+                self.logger.debug(f"Skipping sample file: {name}")
                 return
 
-            self.logger.info(f"New audio file detected: {file_path.name}")
-            # Schedule async task
-            asyncio.create_task(self.file_manager.handle_new_file(file_path.name))
+            self.logger.info(f"New audio file detected: {name}")
+            # Hand over to the event loop, batched by the consumer task
+            self.file_manager.queue_new_file(name)
 
     def on_moved(self, event):
         """Handle file moves (also triggers for renames)"""
         if event.is_directory:
             return
 
-        dest_path = Path(event.dest_path)
-        if dest_path.suffix.lower() in self.audio_extensions:
+        name = os.path.basename(event.dest_path)
+        self.file_manager.notify_file_available(name)
+
+        if _is_audio_name(name):
             # Skip files with "sample" in the name (case-insensitive)
-            if "sample" in dest_path.name.lower():
-                self.logger.debug(f"Skipping sample file: {dest_path.name}")
+            if _SKIP_TOKEN in name.casefold():
+                self.logger.debug(f"Skipping sample file: {name}")
                 return
 
-            self.logger.info(f"Audio file moved/renamed: {dest_path.name}")
-            # Schedule async task
-            asyncio.create_task(self.file_manager.handle_new_file(dest_path.name))
+            self.logger.info(f"Audio file moved/renamed: {name}")
+            # Hand over to the event loop, batched by the consumer task
+            self.file_manager.queue_new_file(name)
 
 
-class FileManager:
+class FileManager(FileManagerMixin):
     """
     Manages file operations and shared directory monitoring
     """
 
+    logger = get_logger(__name__)
+
     def __init__(self, config: Dict[str, Any]):
         self.config = config
-        from core.logger import get_logger
-        self.logger = get_logger(__name__)
 
         # Directory paths
         self.shared_directory = Path(config.get("shared_directory", "./shared"))
         self.temp_directory = Path(config.get("temp_directory", "./temp"))
 
         # Ensure directories exist
-        self.shared_directory.mkdir(parents=True, exist_ok=True)
-        self.temp_directory.mkdir(parents=True, exist_ok=True)
+        from core.config_loader import ensure_directory
+        ensure_directory(self.shared_directory)
+        ensure_directory(self.temp_directory)
 
         # File monitoring
         self.observer = None
         self.monitoring_active = False
 
-        # Status file cache
-        self._status_cache: Dict[str, Dict[str, Any]] = {}
+        # Precomputed paths per filename, see _file_paths
+        self._shared_str = str(self.shared_directory)
+        self._file_slots: Dict[str, _FileSlots] = {}
 
-        # Valid audio extensions
-        self.audio_extensions = {
-            '.mp3', '.wav', '.flac', '.m4a', '.ogg', '.wma',
-            '.aac', '.opus', '.mp4', '.avi', '.mov', '.mkv'
-        }
+        # Parsed .in_progress files as (st_mtime_ns, data), least recently used first
+        self._status_cache: "OrderedDict[str, Tuple[int, Dict[str, Any]]]" = OrderedDict()
+
+        # Per-filename events set by the watcher when a file appears
+        self._file_events: Dict[str, asyncio.Event] = defaultdict(asyncio.Event)
+        # Number of coroutines waiting on each filename's event
+        self._file_waiters: Dict[str, int] = defaultdict(int)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+        # New audio files reported by the watcher, drained by one consumer task
+        self._new_files: Optional[asyncio.Queue] = None
+        self._consumer_task: Optional[asyncio.Task] = None
+
+        # Status data not yet written to .in_progress files, see queue_status_update
+        self._status_pending: Dict[str, Dict[str, Any]] = {}
+        self._status_flush: Optional[asyncio.Task] = None
+        self._status_write_lock = asyncio.Lock()
 
     async def start_monitoring(self):
         """
@@ -313,6 +549,11 @@ class FileManager:
             return
 
         try:
+            # Watchdog callbacks run in the observer thread and need the loop
+            self._loop = asyncio.get_running_loop()
+            self._new_files = asyncio.Queue()
+            self._consumer_task = asyncio.create_task(self._consume_new_files())
+
             # Set up file system observer
             self.observer = Observer()
             handler = AudioFileHandler(self)
@@ -343,39 +584,124 @@ class FileManager:
             self.monitoring_active = False
             self.logger.info("File monitoring stopped")
 
+        if self._consumer_task:
+            self._consumer_task.cancel()
+            self._consumer_task = None
+
+        # Write out status updates still waiting for their flush
+        await self.flush_status_updates()
+
+    def queue_new_file(self, filename: str):
+        """
+        Queue a new audio file for the consumer task
+
+        Safe to call from the watchdog observer thread.
+
+        Args:
+            filename: Name of the audio file
+        """
+        if self._loop is None or self._new_files is None:
+            return
+        self._loop.call_soon_threadsafe(self._new_files.put_nowait, filename)
+
+    async def _consume_new_files(self):
+        """
+        Drain watcher notifications in batches into the task manager
+
+        Waits for the first name, then takes whatever else is already queued
+        (up to _NEW_FILE_BATCH), so a burst of drop-ins becomes one add_tasks
+        call instead of a task per file. Names keep their arrival order.
+        """
+        queue = self._new_files
+        while True:
+            names = [await queue.get()]
+            while len(names) < _NEW_FILE_BATCH and not queue.empty():
+                names.append(queue.get_nowait())
+
+            await self.handle_new_files(names)
+
     async def scan_existing_files(self):
         """
         Scan shared directory for existing audio files that need processing
+
+        The directory is listed once and sibling status files are resolved
+        from that listing instead of a stat per candidate name.
         """
         from api.models import TaskStatus
+        from core.task_manager import get_task_manager
 
         self.logger.info("Scanning for existing audio files...")
 
         try:
-            processed_count = 0
+            pending = []
+            task_manager = get_task_manager()
+
+            entries = await asyncio.to_thread(self._list_shared_files)
 
-            for file_path in self.shared_directory.iterdir():
-                if (file_path.is_file() and
-                    file_path.suffix.lower() in self.audio_extensions):
+            for name in entries:
+                if not _is_audio_name(name):
+                    continue
 
-                    # Skip files with "sample" in the name (case-insensitive)
-                    if "sample" in file_path.name.lower():
-                        self.logger.debug(f"Skipping sample file: {file_path.name}")
-                        continue
+                # Skip files with "sample" in the name (case-insensitive)
+                if _SKIP_TOKEN in name.casefold():
+                    self.logger.debug(f"Skipping sample file: {name}")
+                    continue
 
-                    # Check if file already has a result or is being processed
-                    status = await self.get_file_status(file_path.name)
+                # Check if file already has a result or is being processed
+                status = self._scanned_status(name, entries)
+                if status is None and await task_manager.get_task_info(name):
+                    continue
 
-                    if status is None or status == TaskStatus.ERROR:
-                        # File needs processing
-                        await self.handle_new_file(file_path.name, auto_scan=True)
-                        processed_count += 1
+                if status is None or status == TaskStatus.ERROR:
+                    # File needs processing
+                    pending.append(name)
 
-            self.logger.info(f"Found {processed_count} files needing processing")
+            self.logger.info(f"Found {len(pending)} files needing processing")
+            if pending:
+                await self.handle_new_files(pending, auto_scan=True)
 
         except Exception as e:
             self.logger.error(f"Error scanning existing files: {e}")
 
+    def _list_shared_files(self) -> Dict[str, os.DirEntry]:
+        """List regular files in the shared directory keyed by name (blocking)"""
+        with os.scandir(self.shared_directory) as it:
+            return {entry.name: entry for entry in it if entry.is_file()}
+
+    def _scanned_status(
+        self,
+        filename: str,
+        entries: Dict[str, os.DirEntry]
+    ) -> Optional['TaskStatus']:
+        """
+        Resolve a file's status from a shared directory listing
+
+        Args:
+            filename: Name of the audio file
+            entries: Directory entries keyed by name
+
+        Returns:
+            Status from the .in_progress or .result file, or None if neither exists
+        """
+        from api.models import TaskStatus
+
+        base_name = _stem(filename)
+
+        in_progress = entries.get(f"{base_name}.in_progress")
+        if in_progress is not None:
+            try:
+                data = self._load_status_data(
+                    filename, in_progress.path, in_progress.stat().st_mtime_ns
+                )
+                return TaskStatus(data.get("status", "processing"))
+            except Exception as e:
+                self.logger.warning(f"Error reading in_progress file for {filename}: {e}")
+
+        if f"{base_name}.result" in entries:
+            return TaskStatus.COMPLETED
+
+        return None
+
     async def handle_new_file(self, filename: str, auto_scan: bool = False):
         """
         Handle a new audio file that needs processing
@@ -405,6 +731,36 @@ class FileManager:
         except Exception as e:
             self.logger.error(f"Error handling new file '{filename}': {e}")
 
+    async def handle_new_files(self, filenames: List[str], auto_scan: bool = False):
+        """
+        Queue several new audio files with a single task manager call
+
+        add_tasks keeps the batch in list order, so files are processed in
+        the order they were reported.
+
+        Args:
+            filenames: Names of the audio files (later duplicates are ignored)
+            auto_scan: Whether these come from auto-scan (lower priority)
+        """
+        try:
+            # Import here to avoid circular imports
+            from core.task_manager import get_task_manager
+            from api.models import TaskPriority
+
+            task_manager = get_task_manager()
+
+            # Determine priority
+            priority = TaskPriority.AUTO_SCAN if auto_scan else TaskPriority.API
+
+            # A file written in chunks can be reported more than once
+            unique = list(dict.fromkeys(filenames))
+            await task_manager.add_tasks([(name, None) for name in unique], priority=priority)
+
+            self.logger.info(f"Added {len(unique)} new files to queue with priority {priority.name}")
+
+        except Exception as e:
+            self.logger.error(f"Error handling new files {filenames}: {e}")
+
     async def file_exists(self, filename: str) -> bool:
         """
         Check if a file exists in the shared directory
@@ -415,13 +771,87 @@ class FileManager:
         Returns:
             True if file exists
         """
-        file_path = self.shared_directory / filename
-        return file_path.exists() and file_path.is_file()
+        return os.path.isfile(self._file_paths(filename).original)
+
+    def notify_file_available(self, filename: str):
+        """
+        Wake up coroutines waiting in file_exists_wait for a filename
+
+        Safe to call from the watchdog observer thread.
+
+        Args:
+            filename: Name of the file that appeared in the shared directory
+        """
+        if self._loop is None or filename not in self._file_events:
+            return
+        self._loop.call_soon_threadsafe(self._set_file_event, filename)
+
+    def _set_file_event(self, filename: str):
+        """Set and drop the event for a filename (runs on the event loop)"""
+        event = self._file_events.pop(filename, None)
+        if event is not None:
+            event.set()
+
+    async def file_exists_wait(self, filename: str, timeout: float = 3.0) -> bool:
+        """
+        Wait up to timeout seconds for a file to appear in the shared directory
+
+        Returns immediately if the file already exists. Otherwise waits for the
+        watcher notification, re-checking with exponential backoff starting at
+        100ms in case monitoring is disabled or the event was missed.
+
+        Args:
+            filename: Name of the file to wait for
+            timeout: Maximum time to wait in seconds
+
+        Returns:
+            True if file exists
+        """
+        if await self.file_exists(filename):
+            return True
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        delay = 0.1
+        event = self._file_events[filename]
+        self._file_waiters[filename] += 1
+
+        try:
+            while True:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    return False
+
+                try:
+                    await asyncio.wait_for(event.wait(), timeout=min(delay, remaining))
+                except asyncio.TimeoutError:
+                    pass
+
+                if await self.file_exists(filename):
+                    return True
+
+                if event.is_set():
+                    event = self._file_events[filename]
+                delay *= 2
+        finally:
+            # Only the last waiter drops the event; others still rely on it
+            self._file_waiters[filename] -= 1
+            if self._file_waiters[filename] <= 0:
+                del self._file_waiters[filename]
+                if self._file_events.get(filename) is event and not event.is_set():
+                    self._file_events.pop(filename, None)
 
     async def get_file_status(self, filename: str) -> Optional['TaskStatus']:
         """
         Get the current processing status of a file
 
+        The .in_progress file is checked first on purpose: the task manager
+        rewrites it with the final status when a task completes or fails, so
+        it answers every tracked state (processing, error, completed) with one
+        stat and, thanks to _status_cache, usually no parse. Checking .result
+        first would add a second stat for every file still being processed and
+        could report a stale result while a file is reprocessed.
+
         Args:
             filename: Name of the file
 
@@ -430,35 +860,29 @@ class FileManager:
         """
         from api.models import TaskStatus
 
-        # Check cache first
-        if filename in self._status_cache:
-            cached_data = self._status_cache[filename]
-            status_str = cached_data.get("status")
-            if status_str:
-                try:
-                    return TaskStatus(status_str)
-                except ValueError:
-                    pass
+        # A queued status update is newer than the file on disk
+        pending = self._status_pending.get(filename)
+        if pending is not None:
+            return TaskStatus(pending["status"])
 
         # Check for status files
-        base_name = Path(filename).stem
+        paths = self._file_paths(filename)
 
-        # Check for .in_progress file
-        in_progress_file = self.shared_directory / f"{base_name}.in_progress"
-        if in_progress_file.exists():
+        # Check for .in_progress file, parsing it only when its mtime changed
+        in_progress_file = paths.in_progress
+        try:
+            mtime_ns = os.stat(in_progress_file).st_mtime_ns
+        except FileNotFoundError:
+            self._status_cache.pop(filename, None)
+        else:
             try:
-                with open(in_progress_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    status_str = data.get("status", "processing")
-                    self._status_cache[filename] = data
-                    return TaskStatus(status_str)
+                data = self._load_status_data(filename, in_progress_file, mtime_ns)
+                return TaskStatus(data.get("status", "processing"))
             except Exception as e:
                 self.logger.warning(f"Error reading in_progress file for {filename}: {e}")
 
         # Check for .result file
-        result_file = self.shared_directory / f"{base_name}.result"
-        if result_file.exists():
-            self._status_cache[filename] = {"status": "completed"}
+        if os.path.exists(paths.result):
             return TaskStatus.COMPLETED
 
         # Check queue in TaskManager for pending tasks
@@ -480,6 +904,46 @@ class FileManager:
         # No status information found and file doesn't exist
         return None
 
+    def _load_status_data(
+        self,
+        filename: str,
+        in_progress_file: str,
+        mtime_ns: int
+    ) -> Dict[str, Any]:
+        """
+        Return parsed .in_progress data, re-reading the file only if mtime changed
+
+        Args:
+            filename: Name of the audio file
+            in_progress_file: Path to its .in_progress file
+            mtime_ns: Current st_mtime_ns of the .in_progress file
+
+        Returns:
+            Parsed status data
+        """
+        cached = self._status_cache.get(filename)
+        if cached is not None and cached[0] == mtime_ns:
+            self._status_cache.move_to_end(filename)
+            return cached[1]
+
+        with open(in_progress_file, 'rb') as f:
+            data = _json_loads(f.read())
+        self._cache_status(filename, mtime_ns, data)
+        return data
+
+    def _cache_status(self, filename: str, mtime_ns: int, data: Dict[str, Any]):
+        """Store parsed status data, evicting the least recently used entries"""
+        self._status_cache[filename] = (mtime_ns, data)
+        self._status_cache.move_to_end(filename)
+        while len(self._status_cache) > _STATUS_CACHE_SIZE:
+            self._status_cache.popitem(last=False)
+
+    @staticmethod
+    def _write_status_file(status_file: str, data: bytes) -> int:
+        """Write a status file atomically and return its new st_mtime_ns (blocking)"""
+        _write_atomic(status_file, data)
+        return os.stat(status_file).st_mtime_ns
+
     async def update_status_file(
         self,
         filename: str,
@@ -494,28 +958,99 @@ class FileManager:
             status: Current processing status
             additional_data: Additional data to include in status file
         """
-        base_name = Path(filename).stem
-        status_file = self.shared_directory / f"{base_name}.in_progress"
+        status_data = self._status_data(filename, status, additional_data)
 
-        # Prepare status data
+        # Supersedes any queued update for this file
+        self._status_pending.pop(filename, None)
+        async with self._status_write_lock:
+            await self._write_status(filename, status_data)
+
+    def queue_status_update(
+        self,
+        filename: str,
+        status,  # Remove type hint to avoid circular import
+        additional_data: Optional[Dict[str, Any]] = None
+    ):
+        """
+        Queue a status file update to be written by a background flush
+
+        Updates queued for the same file within _STATUS_FLUSH_DELAY are
+        coalesced into a single write of the latest one. Until it is written,
+        get_file_status and get_processing_info answer from the queued data.
+        Must be called from the event loop.
+
+        Args:
+            filename: Name of the audio file
+            status: Current processing status
+            additional_data: Additional data to include in status file
+        """
+        self._status_pending[filename] = self._status_data(filename, status, additional_data)
+
+        if self._status_flush is None or self._status_flush.done():
+            self._status_flush = asyncio.create_task(self._flush_status_later())
+
+    async def _flush_status_later(self):
+        """Wait for more updates to coalesce, then write all queued ones"""
+        await asyncio.sleep(_STATUS_FLUSH_DELAY)
+        # Updates queued while a batch was being written go out in the next one
+        while self._status_pending:
+            await self.flush_status_updates()
+
+    async def flush_status_updates(self):
+        """Write all queued status updates now, concurrently"""
+        async with self._status_write_lock:
+            # Entries stay queued while written, so readers never fall back to
+            # an older file on disk in the meantime
+            pending = dict(self._status_pending)
+            if pending:
+                await asyncio.gather(*(
+                    self._write_status(filename, status_data)
+                    for filename, status_data in pending.items()
+                ))
+
+            # Keep updates queued during the write for the next flush
+            for filename, status_data in pending.items():
+                if self._status_pending.get(filename) is status_data:
+                    del self._status_pending[filename]
+
+    @staticmethod
+    def _status_data(
+        filename: str,
+        status,
+        additional_data: Optional[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """Build the contents of an .in_progress file"""
         status_data = {
             "filename": filename,
             "status": status.value,
-            "updated_at": datetime.now().isoformat()
+            "updated_at_ns": time.time_ns()
         }
 
         if additional_data:
             status_data.update(additional_data)
 
+        return status_data
+
+    async def _write_status(self, filename: str, status_data: Dict[str, Any]):
+        """
+        Write status data to the .in_progress file and cache it
+
+        Args:
+            filename: Name of the audio file
+            status_data: Contents of the status file
+        """
+        status_file = self._file_paths(filename).in_progress
+
         try:
             # Save status file
-            with open(status_file, 'w', encoding='utf-8') as f:
-                json.dump(status_data, f, indent=2, ensure_ascii=False)
+            mtime_ns = await asyncio.to_thread(
+                self._write_status_file, status_file, _json_dumps(status_data)
+            )
 
             # Update cache
-            self._status_cache[filename] = status_data
+            self._cache_status(filename, mtime_ns, status_data)
 
-            self.logger.debug(f"Updated status file for '{filename}': {status.value}")
+            self.logger.debug(f"Updated status file for '{filename}': {status_data['status']}")
 
         except Exception as e:
             self.logger.error(f"Error updating status file for '{filename}': {e}")
@@ -532,18 +1067,18 @@ class FileManager:
         """
         debug_info = {}
 
-        # File existence
-        debug_info["file_exists"] = await self.file_exists(filename)
-
-        # File size and modification time
-        if debug_info["file_exists"]:
-            file_path = self.shared_directory / filename
-            try:
-                stat = file_path.stat()
+        # File existence, size and modification time from a single stat
+        try:
+            stat = os.stat(self._file_paths(filename).original)
+            debug_info["file_exists"] = S_ISREG(stat.st_mode)
+            if debug_info["file_exists"]:
                 debug_info["file_size"] = stat.st_size
                 debug_info["file_modified"] = datetime.fromtimestamp(stat.st_mtime).isoformat()
-            except Exception as e:
-                debug_info["file_stat_error"] = str(e)
+        except FileNotFoundError:
+            debug_info["file_exists"] = False
+        except Exception as e:
+            debug_info["file_exists"] = False
+            debug_info["file_stat_error"] = str(e)
 
         # Processing info
         processing_info = await self.get_processing_info(filename)
@@ -557,7 +1092,7 @@ class FileManager:
 
         # Cache info
         if filename in self._status_cache:
-            debug_info["cached_status"] = self._status_cache[filename]
+            debug_info["cached_status"] = self._status_cache[filename][1]
 
         return debug_info if debug_info else None
 
@@ -3,12 +3,20 @@ Logging configuration for Audio Transcriber API
 Provides structured logging with English-only messages
 """
 
+import atexit
+import functools
 import logging
 import logging.handlers
+import queue
 import sys
+import threading
+import time
 from pathlib import Path
-from datetime import datetime
-from typing import Optional
+from typing import Dict, List, Optional
+
+
+# Background listeners writing records for each configured logger
+_listeners: Dict[Optional[str], logging.handlers.QueueListener] = {}
 
 
 class ColoredFormatter(logging.Formatter):
@@ -24,21 +32,21 @@ class ColoredFormatter(logging.Formatter):
         'RESET': '\033[0m'       # Reset
     }
 
-    def format(self, record):
-        """Format log record with colors"""
-        # Add color to levelname
-        levelname = record.levelname
-        if levelname in self.COLORS:
-            colored_levelname = f"{self.COLORS[levelname]}{levelname}{self.COLORS['RESET']}"
-            record.levelname = colored_levelname
-
-        # Format the message
-        formatted = super().format(record)
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
 
-        # Reset levelname for future use
-        record.levelname = levelname
+        # Colored level names built once, used via %(colored_level)s
+        reset = self.COLORS['RESET']
+        self._colored_levels = {
+            level: f"{color}{level}{reset}"
+            for level, color in self.COLORS.items()
+            if level != 'RESET'
+        }
 
-        return formatted
+    def formatMessage(self, record):
+        """Format log record with colors"""
+        record.colored_level = self._colored_levels.get(record.levelname, record.levelname)
+        return super().formatMessage(record)
 
 
 def setup_logger(
@@ -52,6 +60,10 @@ def setup_logger(
     """
     Setup logger with both file and console handlers
 
+    The handlers run on a QueueListener thread; the logger itself only
+    enqueues records, so callers on the event loop never block on stdout
+    writes or log file rotation.
+
     Args:
         name: Logger name (default: root logger)
         level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
@@ -70,6 +82,8 @@ def setup_logger(
 
     # Clear any existing handlers
     logger.handlers.clear()
+    _stop_listener(name)
+    handlers: List[logging.Handler] = []
 
     # Create formatters
     file_formatter = logging.Formatter(
@@ -78,7 +92,7 @@ def setup_logger(
     )
 
     console_formatter = ColoredFormatter(
-        fmt='[%(asctime)s] [%(levelname)s] [%(name)s] %(message)s',
+        fmt='[%(asctime)s] [%(colored_level)s] [%(name)s] %(message)s',
         datefmt='%H:%M:%S'
     )
 
@@ -94,17 +108,56 @@ def setup_logger(
             encoding='utf-8'
         )
         file_handler.setFormatter(file_formatter)
-        logger.addHandler(file_handler)
+        handlers.append(file_handler)
 
     # Console handler
     if console_output:
         console_handler = logging.StreamHandler(sys.stdout)
         console_handler.setFormatter(console_formatter)
-        logger.addHandler(console_handler)
+        handlers.append(console_handler)
+
+    if handlers:
+        log_queue = queue.SimpleQueue()
+        logger.addHandler(logging.handlers.QueueHandler(log_queue))
+
+        listener = logging.handlers.QueueListener(
+            log_queue, *handlers, respect_handler_level=True
+        )
+        listener.start()
+        _listeners[name] = listener
 
     return logger
 
 
+def _stop_listener(name: Optional[str], restore: bool = False) -> None:
+    """
+    Stop the queue listener of a logger, flushing pending records
+
+    Args:
+        name: Logger name the listener was set up for
+        restore: Attach the listener's handlers directly to the logger so
+            records logged afterwards are still written
+    """
+    listener = _listeners.pop(name, None)
+    if listener is None:
+        return
+
+    listener.stop()
+    if restore:
+        logger = logging.getLogger(name)
+        for handler in list(logger.handlers):
+            if isinstance(handler, logging.handlers.QueueHandler):
+                logger.removeHandler(handler)
+        for handler in listener.handlers:
+            logger.addHandler(handler)
+
+
+def stop_logging() -> None:
+    """Flush queued log records and stop all listener threads"""
+    for name in list(_listeners):
+        _stop_listener(name, restore=True)
+
+
 def get_logger(name: str) -> logging.Logger:
     """
     Get logger instance with module name
@@ -125,7 +178,7 @@ def setup_uvicorn_logger() -> None:
 
     # Use our formatter for uvicorn logs
     console_formatter = ColoredFormatter(
-        fmt='[%(asctime)s] [%(levelname)s] [%(name)s] %(message)s',
+        fmt='[%(asctime)s] [%(colored_level)s] [%(name)s] %(message)s',
         datefmt='%H:%M:%S'
     )
 
@@ -140,20 +193,25 @@ def log_function_call(func):
     """
     Decorator to log function calls with parameters and execution time
     """
+    logger = get_logger(func.__module__)
+
+    @functools.wraps(func)
     def wrapper(*args, **kwargs):
-        logger = get_logger(func.__module__)
-        start_time = datetime.now()
+        debug = logger.isEnabledFor(logging.DEBUG)
+        start_ns = time.perf_counter_ns()
 
         # Log function entry
-        logger.debug(f"Calling {func.__name__} with args={args}, kwargs={kwargs}")
+        if debug:
+            logger.debug("Calling %s with args=%s, kwargs=%s", func.__name__, args, kwargs)
 
         try:
             result = func(*args, **kwargs)
-            execution_time = (datetime.now() - start_time).total_seconds()
-            logger.debug(f"Function {func.__name__} completed in {execution_time:.3f}s")
+            if debug:
+                execution_time = (time.perf_counter_ns() - start_ns) / 1e9
+                logger.debug("Function %s completed in %.3fs", func.__name__, execution_time)
             return result
         except Exception as e:
-            execution_time = (datetime.now() - start_time).total_seconds()
+            execution_time = (time.perf_counter_ns() - start_ns) / 1e9
             logger.error(f"Function {func.__name__} failed after {execution_time:.3f}s: {e}")
             raise
 
@@ -182,20 +240,36 @@ def log_api_response(response_info: dict) -> None:
     logger.info(f"API Response: {response_info}")
 
 
+# Set once init_default_logger has configured logging
+_initialized = False
+_init_lock = threading.Lock()
+
+
 # Initialize default logger
 def init_default_logger():
-    """Initialize the default application logger"""
-    setup_logger(
-        name="audio_transcriber",
-        level="INFO",
-        log_file=None,  # No log file - use stdout/stderr for Docker
-        console_output=True
-    )
+    """
+    Initialize the default application logger
+
+    Safe to call more than once or from several threads; only the first
+    call configures handlers. Called explicitly by the application entry
+    point instead of on import.
+    """
+    global _initialized
+    with _init_lock:
+        if _initialized:
+            return
+
+        setup_logger(
+            name="audio_transcriber",
+            level="INFO",
+            log_file=None,  # No log file - use stdout/stderr for Docker
+            console_output=True
+        )
 
-    # Setup uvicorn logging
-    setup_uvicorn_logger()
+        # Setup uvicorn logging
+        setup_uvicorn_logger()
+        _initialized = True
 
 
-# Auto-initialize when module is imported
-if not logging.getLogger().handlers:
-    init_default_logger()
+# Listener threads are daemons, drain them before the interpreter exits
+atexit.register(stop_logging)
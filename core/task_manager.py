@@ -4,19 +4,32 @@ Implements priority queue system for processing audio transcription tasks
 """
 
 import asyncio
+import heapq
 import uuid
-import logging
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
+from collections import OrderedDict
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Optional, Any, Set, Tuple
 from dataclasses import dataclass, field
-from queue import PriorityQueue
-from threading import Lock
+from itertools import count
+from operator import attrgetter
 
 from api.models import TaskPriority, TaskStatus, TaskInfo, TranscribeRequest
+from core.file_manager import FileManager, get_file_manager
 from core.logger import get_logger
+from core.transcriber import WhisperXTranscriber, get_transcriber
 
 
-@dataclass
+# Weight of the newest task in the processing time average
+_AVG_ALPHA = 0.2
+
+# Sort key matching ProcessingTask.__lt__, compared without a Python-level call
+_ORDER_KEY = attrgetter("_order_key")
+
+# Creation order of tasks, breaking ties between tasks created at the same time
+_task_sequence = count()
+
+
+@dataclass(slots=True)
 class ProcessingTask:
     """
     Task object for processing queue with priority support
@@ -25,21 +38,26 @@ class ProcessingTask:
     filename: str
     priority: TaskPriority
     status: TaskStatus
-    created_at: datetime
+    created_at: datetime = field(default_factory=datetime.now)
     transcribe_request: Optional[TranscribeRequest] = None
     started_at: Optional[datetime] = None
     completed_at: Optional[datetime] = None
     error_message: Optional[str] = None
     retry_count: int = 0
     client_id: Optional[str] = None
+    # Set when the task is removed or replaced; its heap entry is skipped later
+    cancelled: bool = False
+    # Creation order: batched tasks share created_at but keep submission order
+    sequence: int = field(default_factory=lambda: next(_task_sequence), repr=False, compare=False)
+    # Heap ordering key: lower priority number first, then older tasks first
+    _order_key: Tuple[int, datetime, int] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self._order_key = (int(self.priority), self.created_at, self.sequence)
 
     def __lt__(self, other):
         """Priority comparison for queue ordering"""
-        # Lower priority number = higher priority
-        if self.priority != other.priority:
-            return self.priority < other.priority
-        # If same priority, older tasks first
-        return self.created_at < other.created_at
+        return self._order_key < other._order_key
 
 
 class TaskManager:
@@ -52,19 +70,43 @@ class TaskManager:
         self.config = config
         self.logger = get_logger(__name__)
 
-        # Priority queue for tasks
-        self._task_queue = PriorityQueue()
-        self._queue_lock = Lock()
+        # Priority queue for tasks: a heapq list, only touched from the event loop
+        self._task_queue: List[ProcessingTask] = []
+        self._queue_lock = asyncio.Lock()
 
-        # Task tracking
+        # Set whenever a task is queued (or on stop) to wake the processing loop
+        self._wakeup = asyncio.Event()
+
+        # Task tracking; _pending holds the PENDING subset of _active_tasks
         self._active_tasks: Dict[str, ProcessingTask] = {}
-        self._completed_tasks: Dict[str, ProcessingTask] = {}
+        self._pending: Dict[str, ProcessingTask] = {}
+        # The same pending tasks split into one band per priority level
+        self._pending_by_prio: Dict[TaskPriority, Dict[str, ProcessingTask]] = {
+            priority: {} for priority in TaskPriority
+        }
+        self._tasks_by_id: Dict[str, ProcessingTask] = {}
+
+        # Task ids are a per-process random prefix plus a counter, so only one
+        # uuid4() call is made and ids stay unique across restarts
+        self._id_prefix = uuid.uuid4().hex[:8]
+        self._id_counter = count(1)
+        # Finished tasks, oldest first, capped at max_completed_history
+        self._completed_tasks: "OrderedDict[str, ProcessingTask]" = OrderedDict()
+        self._max_completed = config.get("max_completed_history", 1000)
         self._processing_task: Optional[ProcessingTask] = None
 
         # Processing control
         self._processing_active = False
         self._stop_processing = False
-        self._current_process = None
+        # Set when the processing loop has exited
+        self._stopped = asyncio.Event()
+
+        # Pending delayed re-queues of failed tasks waiting out their backoff
+        self._retry_waits: Set[asyncio.Task] = set()
+
+        # Shared transcriber and file manager, resolved in start_processing
+        self._transcriber: Optional[WhisperXTranscriber] = None
+        self._file_manager: Optional[FileManager] = None
 
         # Statistics
         self._stats = {
@@ -73,6 +115,10 @@ class TaskManager:
             "avg_processing_time": 0.0
         }
 
+        # Tasks finished (successfully or not) on _completed_today_date
+        self._completed_today = 0
+        self._completed_today_date = date.today()
+
     async def add_task(
         self,
         filename: str,
@@ -92,29 +138,66 @@ class TaskManager:
         Returns:
             Task ID
         """
-        task_id = str(uuid.uuid4())
+        task_id = self._next_task_id()
 
         task = ProcessingTask(
             task_id=task_id,
             filename=filename,
             priority=priority,
             status=TaskStatus.PENDING,
-            created_at=datetime.now(),
             transcribe_request=transcribe_request,
             client_id=client_id
         )
 
-        # Remove any existing task for this filename
-        await self.remove_task(filename)
-
-        # Add to queue and tracking
-        with self._queue_lock:
-            self._task_queue.put(task)
-            self._active_tasks[filename] = task
+        # Replace any existing task for this filename and queue the new one
+        async with self._queue_lock:
+            old_task = self._track_task(task)
+            self._wakeup.set()
 
+        if old_task is not None:
+            self.logger.info(f"Removed task {old_task.task_id} for file '{filename}'")
         self.logger.info(f"Added task {task_id} for file '{filename}' with priority {priority.name}")
         return task_id
 
+    async def add_tasks(
+        self,
+        tasks: List[Tuple[str, Optional[TranscribeRequest]]],
+        priority: TaskPriority,
+        client_id: Optional[str] = None
+    ) -> List[str]:
+        """
+        Add several tasks to priority queue under a single lock acquisition
+
+        Args:
+            tasks: List of (filename, transcribe_request) pairs
+            priority: Task priority level for all tasks
+            client_id: Optional client identifier
+
+        Returns:
+            Task IDs in the same order as tasks
+        """
+        now = datetime.now()
+        new_tasks = [
+            ProcessingTask(
+                task_id=self._next_task_id(),
+                filename=filename,
+                priority=priority,
+                status=TaskStatus.PENDING,
+                created_at=now,
+                transcribe_request=transcribe_request,
+                client_id=client_id
+            )
+            for filename, transcribe_request in tasks
+        ]
+
+        async with self._queue_lock:
+            for task in new_tasks:
+                self._track_task(task)
+            self._wakeup.set()
+
+        self.logger.info(f"Added {len(new_tasks)} tasks with priority {priority.name}")
+        return [task.task_id for task in new_tasks]
+
     async def remove_task(self, filename: str) -> bool:
         """
         Remove task from queue and tracking
@@ -125,13 +208,60 @@ class TaskManager:
         Returns:
             True if task was removed, False if not found
         """
-        with self._queue_lock:
+        async with self._queue_lock:
             if filename in self._active_tasks:
+                # Leave the heap entry in place, it is dropped when popped
                 task = self._active_tasks.pop(filename)
+                self._drop_pending(task)
+                self._tasks_by_id.pop(task.task_id, None)
+                task.cancelled = True
                 self.logger.info(f"Removed task {task.task_id} for file '{filename}'")
                 return True
         return False
 
+    def _track_task(self, task: ProcessingTask) -> Optional[ProcessingTask]:
+        """
+        Queue a new task, cancelling any existing task for the same file
+
+        Must be called with _queue_lock held.
+
+        Args:
+            task: New pending task
+
+        Returns:
+            The replaced task, or None if the file had no active task
+        """
+        old_task = self._active_tasks.get(task.filename)
+        if old_task is not None:
+            # Leave the old heap entry in place, it is dropped when popped
+            old_task.cancelled = True
+            self._drop_pending(old_task)
+            self._tasks_by_id.pop(old_task.task_id, None)
+
+        heapq.heappush(self._task_queue, task)
+        self._active_tasks[task.filename] = task
+        self._add_pending(task)
+        self._tasks_by_id[task.task_id] = task
+        return old_task
+
+    def _next_task_id(self) -> str:
+        """Mint a new task id"""
+        return f"{self._id_prefix}-{next(self._id_counter):x}"
+
+    def _add_pending(self, task: ProcessingTask):
+        """Record a task as pending (replacing any pending task for its file)"""
+        old_task = self._pending.get(task.filename)
+        if old_task is not None:
+            self._pending_by_prio[old_task.priority].pop(task.filename, None)
+        self._pending[task.filename] = task
+        self._pending_by_prio[task.priority][task.filename] = task
+
+    def _drop_pending(self, task: ProcessingTask):
+        """Forget a pending task, if it is the one recorded for its file"""
+        if self._pending.get(task.filename) is task:
+            del self._pending[task.filename]
+            del self._pending_by_prio[task.priority][task.filename]
+
     async def get_highest_priority_task(self) -> Optional[ProcessingTask]:
         """
         Get the highest priority task from queue
@@ -139,25 +269,29 @@ class TaskManager:
         Returns:
             Next task to process or None if queue is empty
         """
-        with self._queue_lock:
-            # Clean up invalid tasks from queue
-            valid_tasks = []
+        async with self._queue_lock:
+            # Pop until a live task, discarding tombstones of removed ones
+            while self._task_queue:
+                task = heapq.heappop(self._task_queue)
+                if not task.cancelled:
+                    self._drop_pending(task)
+                    return task
 
-            while not self._task_queue.empty():
-                task = self._task_queue.get()
-                # Only include tasks that are still active
-                if task.filename in self._active_tasks:
-                    valid_tasks.append(task)
+            return None
 
-            # Put valid tasks back and get the highest priority one
-            next_task = None
-            for task in valid_tasks:
-                if next_task is None:
-                    next_task = task
-                else:
-                    self._task_queue.put(task)
+    async def _peek_next_task(self) -> Optional[ProcessingTask]:
+        """
+        Get the task that will be processed next, leaving it queued
 
-            return next_task
+        Returns:
+            Next task to process or None if queue is empty
+        """
+        async with self._queue_lock:
+            # Tombstones on top would be discarded by the next pop anyway
+            while self._task_queue and self._task_queue[0].cancelled:
+                heapq.heappop(self._task_queue)
+
+            return self._task_queue[0] if self._task_queue else None
 
     async def start_processing(self):
         """
@@ -167,8 +301,14 @@ class TaskManager:
             self.logger.warning("Task processing is already active")
             return
 
+        # Reuse the global instances for every task instead of building a
+        # transcriber per task
+        self._transcriber = get_transcriber()
+        self._file_manager = get_file_manager()
+
         self._processing_active = True
         self._stop_processing = False
+        self._stopped.clear()
         self.logger.info("Started task processing loop")
 
         while not self._stop_processing:
@@ -177,8 +317,9 @@ class TaskManager:
                 task = await self.get_highest_priority_task()
 
                 if task is None:
-                    # No tasks available, wait a bit
-                    await asyncio.sleep(1)
+                    # No tasks available, sleep until one is queued
+                    await self._wakeup.wait()
+                    self._wakeup.clear()
                     continue
 
                 # Process the task
@@ -189,27 +330,33 @@ class TaskManager:
                 await asyncio.sleep(5)  # Wait before retrying
 
         self._processing_active = False
+        self._stopped.set()
         self.logger.info("Stopped task processing loop")
 
     async def stop(self):
         """Stop the task processing"""
         self.logger.info("Stopping task manager...")
         self._stop_processing = True
+        self._wakeup.set()
+
+        # Drop retries still waiting out their backoff
+        for retry_wait in list(self._retry_waits):
+            retry_wait.cancel()
 
         # Interrupt current processing if active
-        if self._current_process:
+        if self._processing_task is not None:
             await self.interrupt_processing(self._processing_task.filename)
 
         # Wait for processing to stop
-        timeout = 30  # 30 seconds timeout
-        while self._processing_active and timeout > 0:
-            await asyncio.sleep(1)
-            timeout -= 1
+        if not self._processing_active:
+            self.logger.info("Task manager stopped successfully")
+            return
 
-        if self._processing_active:
-            self.logger.warning("Task processing did not stop gracefully")
-        else:
+        try:
+            await asyncio.wait_for(self._stopped.wait(), timeout=30)
             self.logger.info("Task manager stopped successfully")
+        except asyncio.TimeoutError:
+            self.logger.warning("Task processing did not stop gracefully")
 
     async def _process_task(self, task: ProcessingTask):
         """
@@ -225,28 +372,35 @@ class TaskManager:
         task.started_at = datetime.now()
         self._processing_task = task
 
-        try:
-            # Import here to avoid circular imports
-            from core.transcriber import WhisperXTranscriber
-            from core.file_manager import get_file_manager
-
-            # Create transcriber instance
-            transcriber = WhisperXTranscriber(self.config)
-            file_manager = get_file_manager()
+        transcriber = self._transcriber
+        file_manager = self._file_manager
 
+        try:
             # Update status file
-            await file_manager.update_status_file(task.filename, TaskStatus.PROCESSING, {
+            file_manager.queue_status_update(task.filename, TaskStatus.PROCESSING, {
                 "task_id": task.task_id,
                 "started_at": task.started_at.isoformat(),
                 "progress": 0
             })
 
+            # Decode the next file's audio while this one is transcribed
+            next_task = await self._peek_next_task()
+            if next_task is not None:
+                transcriber.prefetch_audio(next_task.filename)
+
             # Execute transcription
             result = await transcriber.transcribe_file(
                 task.filename,
                 task.transcribe_request
             )
 
+            # Removed, replaced by a resubmit or shut down while the run could not
+            # be interrupted (in-process backend, output parsing): discard the
+            # result so it does not overwrite the newer state of the file
+            if task.cancelled or self._stop_processing:
+                self.logger.info(f"Discarding result of task {task.task_id}, it was cancelled")
+                return
+
             # Save result
             await file_manager.save_result(task.filename, result)
 
@@ -255,25 +409,32 @@ class TaskManager:
             task.completed_at = datetime.now()
 
             # Update status file
-            await file_manager.update_status_file(task.filename, TaskStatus.COMPLETED, {
+            file_manager.queue_status_update(task.filename, TaskStatus.COMPLETED, {
                 "task_id": task.task_id,
                 "completed_at": task.completed_at.isoformat(),
                 "progress": 100
             })
 
             # Move to completed tasks
-            with self._queue_lock:
-                if task.filename in self._active_tasks:
-                    self._active_tasks.pop(task.filename)
-                self._completed_tasks[task.filename] = task
+            async with self._queue_lock:
+                if self._active_tasks.get(task.filename) is task:
+                    del self._active_tasks[task.filename]
+                self._tasks_by_id.pop(task.task_id, None)
+                self._remember_completed(task)
 
             # Update statistics
             processing_time = (task.completed_at - task.started_at).total_seconds()
-            self._update_stats(processing_time, success=True)
+            self._update_stats(processing_time, success=True, finished_at=task.completed_at)
 
             self.logger.info(f"Successfully completed task {task.task_id} in {processing_time:.2f}s")
 
         except Exception as e:
+            # Removed (e.g. deleted) or shut down while running: the process was
+            # interrupted on purpose, so neither retry nor write a status file
+            if task.cancelled or self._stop_processing:
+                self.logger.info(f"Task {task.task_id} was interrupted")
+                return
+
             self.logger.error(f"Error processing task {task.task_id}: {e}")
 
             # Handle retry logic
@@ -286,23 +447,23 @@ class TaskManager:
                 delay = 2 ** task.retry_count
                 self.logger.info(f"Retrying task {task.task_id} in {delay} seconds (attempt {task.retry_count + 1})")
 
-                # Reset status and re-queue
+                # Reset status and re-queue once the backoff has passed; the
+                # loop moves on to other queued tasks in the meantime
                 task.status = TaskStatus.PENDING
                 task.started_at = None
+                if not task.cancelled:
+                    self._add_pending(task)
 
-                await asyncio.sleep(delay)
-
-                with self._queue_lock:
-                    self._task_queue.put(task)
+                retry_wait = asyncio.create_task(self._requeue_after(task, delay))
+                self._retry_waits.add(retry_wait)
+                retry_wait.add_done_callback(self._retry_waits.discard)
             else:
                 # Max retries exceeded
                 task.status = TaskStatus.ERROR
                 task.completed_at = datetime.now()
 
                 # Update status file with error
-                from core.file_manager import get_file_manager
-                file_manager = get_file_manager()
-                await file_manager.update_status_file(task.filename, TaskStatus.ERROR, {
+                file_manager.queue_status_update(task.filename, TaskStatus.ERROR, {
                     "task_id": task.task_id,
                     "error": task.error_message,
                     "retry_count": task.retry_count,
@@ -310,18 +471,41 @@ class TaskManager:
                 })
 
                 # Move to completed tasks
-                with self._queue_lock:
-                    if task.filename in self._active_tasks:
-                        self._active_tasks.pop(task.filename)
-                    self._completed_tasks[task.filename] = task
+                async with self._queue_lock:
+                    if self._active_tasks.get(task.filename) is task:
+                        del self._active_tasks[task.filename]
+                    self._tasks_by_id.pop(task.task_id, None)
+                    self._remember_completed(task)
 
-                self._update_stats(0, success=False)
+                self._update_stats(0, success=False, finished_at=task.completed_at)
 
                 self.logger.error(f"Task {task.task_id} failed after {max_retries} retries")
 
         finally:
             self._processing_task = None
-            self._current_process = None
+
+    async def _requeue_after(self, task: ProcessingTask, delay: float):
+        """
+        Push a failed task back onto the queue after its retry backoff
+
+        Args:
+            task: Task to retry
+            delay: Backoff in seconds
+        """
+        await asyncio.sleep(delay)
+
+        async with self._queue_lock:
+            if not task.cancelled:
+                heapq.heappush(self._task_queue, task)
+                self._wakeup.set()
+
+    def _remember_completed(self, task: ProcessingTask):
+        """Record a finished task, evicting the oldest past the history cap"""
+        completed = self._completed_tasks
+        completed.pop(task.filename, None)
+        completed[task.filename] = task
+        while len(completed) > self._max_completed:
+            completed.popitem(last=False)
 
     async def interrupt_processing(self, filename: str) -> bool:
         """
@@ -333,20 +517,25 @@ class TaskManager:
         Returns:
             True if processing was interrupted
         """
+        process = self._transcriber.current_process if self._transcriber else None
+
         if (self._processing_task and
             self._processing_task.filename == filename and
-            self._current_process):
+            process is not None and
+            process.returncode is None):
 
             self.logger.info(f"Interrupting processing of file '{filename}'")
 
             try:
-                # Terminate the current process
-                self._current_process.terminate()
-                await asyncio.sleep(2)
-
-                if self._current_process.poll() is None:
+                # Terminate the current process, waiting only as long as it
+                # takes to exit
+                process.terminate()
+                try:
+                    await asyncio.wait_for(process.wait(), timeout=2)
+                except asyncio.TimeoutError:
                     # Force kill if still running
-                    self._current_process.kill()
+                    process.kill()
+                    await process.wait()
 
                 return True
             except Exception as e:
@@ -395,28 +584,23 @@ class TaskManager:
         Returns:
             Queue position (1-based) or None if not in queue
         """
-        if filename not in self._active_tasks:
-            return None
-
-        target_task = self._active_tasks[filename]
-        if target_task.status != TaskStatus.PENDING:
+        target_task = self._pending.get(filename)
+        if target_task is None:
             return None
 
-        # Count pending tasks with higher priority or earlier creation time
-        position = 1
-
-        for task_filename, task in self._active_tasks.items():
-            if (task.status == TaskStatus.PENDING and
-                task_filename != filename):
-
-                # Higher priority comes first
-                if task.priority.value < target_task.priority.value:
-                    position += 1
-                # Same priority, earlier creation time comes first
-                elif (task.priority.value == target_task.priority.value and
-                      task.created_at < target_task.created_at):
-                    position += 1
+        # Every task in a higher priority band comes first. TaskPriority is
+        # an int enum, so members compare directly.
+        target_priority = target_task.priority
+        position = 1 + sum(
+            len(band) for priority, band in self._pending_by_prio.items()
+            if priority < target_priority
+        )
 
+        # Within the target's own band, earlier tasks come first
+        target_order = target_task._order_key
+        for task in self._pending_by_prio[target_priority].values():
+            if task._order_key < target_order:
+                position += 1
 
         return position
 
@@ -431,11 +615,7 @@ class TaskManager:
             Estimated wait time in seconds or None
         """
         # Find the task
-        task = None
-        for t in self._active_tasks.values():
-            if t.task_id == task_id:
-                task = t
-                break
+        task = self._tasks_by_id.get(task_id)
 
         if not task or task.status != TaskStatus.PENDING:
             return None
@@ -471,14 +651,14 @@ class TaskManager:
         Returns:
             Dictionary with queue statistics
         """
-        pending_tasks = [t for t in self._active_tasks.values() if t.status == TaskStatus.PENDING]
-        processing_tasks = [t for t in self._active_tasks.values() if t.status == TaskStatus.PROCESSING]
+        # Tasks run one at a time, so at most the current one is processing
+        current = self._processing_task
+        processing = 1 if current is not None and current.status == TaskStatus.PROCESSING else 0
 
         return {
-            "length": len(pending_tasks),
-            "processing": len(processing_tasks),
-            "completed_today": len([t for t in self._completed_tasks.values()
-                                  if t.completed_at and t.completed_at.date() == datetime.now().date()]),
+            "length": len(self._pending),
+            "processing": processing,
+            "completed_today": self._completed_today if self._completed_today_date == date.today() else 0,
             "tasks": [
                 {
                     "task_id": t.task_id,
@@ -487,19 +667,37 @@ class TaskManager:
                     "status": t.status.value,
                     "created_at": t.created_at.isoformat()
                 }
-                for t in pending_tasks[:10]  # Show first 10 pending tasks
+                # Show the first 10 pending tasks in queue order
+                for t in heapq.nsmallest(10, self._pending.values(), key=_ORDER_KEY)
             ],
             "stats": self._stats
         }
 
-    def _update_stats(self, processing_time: float, success: bool):
-        """Update processing statistics"""
+    def _update_stats(self, processing_time: float, success: bool, finished_at: datetime):
+        """
+        Update processing statistics
+
+        Args:
+            processing_time: Seconds the task took to process
+            success: Whether the task completed without error
+            finished_at: When the task finished, reused instead of reading the clock
+        """
+        today = finished_at.date()
+        if today != self._completed_today_date:
+            self._completed_today = 0
+            self._completed_today_date = today
+        self._completed_today += 1
+
         if success:
             self._stats["total_processed"] += 1
-            # Update average processing time
-            total = self._stats["total_processed"]
-            current_avg = self._stats["avg_processing_time"]
-            self._stats["avg_processing_time"] = ((current_avg * (total - 1)) + processing_time) / total
+            # Exponentially weighted average, so the estimate follows recent
+            # tasks (e.g. after a model change); the first sample seeds it
+            if self._stats["total_processed"] == 1:
+                self._stats["avg_processing_time"] = processing_time
+            else:
+                self._stats["avg_processing_time"] += _AVG_ALPHA * (
+                    processing_time - self._stats["avg_processing_time"]
+                )
         else:
             self._stats["total_errors"] += 1
 
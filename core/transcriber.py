@@ -4,17 +4,125 @@ Handles subprocess execution of WhisperX with proper error handling and timeouts
 """
 
 import asyncio
+import importlib.util
 import json
-import logging
+import os
 import subprocess
-import tempfile
+import sys
+import time
+import uuid
+import wave
 import shutil
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime
 
-from api.models import TranscribeRequest, TranscriptionResult, TranscriptionSegment
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is listed in requirements.txt
+    orjson = None
+
+from api.models import (
+    TranscribeRequest, TranscriptionResult, TranscriptionSegment,
+    WhisperModel, ComputeType, OutputFormat
+)
 from core.logger import get_logger
+from core.whisperx_engine import WhisperXEngine
+from core.whisperx_worker import WhisperXWorkerPool
+
+
+# WhisperX pipes are drained in chunks of this size, keeping only the last
+# _OUTPUT_TAIL bytes of each so a chatty run cannot grow memory unbounded
+_PIPE_CHUNK = 64 * 1024
+_OUTPUT_TAIL = 256 * 1024
+
+# WhisperX output JSON is parsed from raw bytes
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+# Local models live in <model_directory>/faster-whisper-<name>
+_MODEL_DIR_PREFIX = "faster-whisper-"
+
+# Models WhisperX can download on demand, always reported as available
+_DEFAULT_MODELS = frozenset(model.value for model in WhisperModel)
+
+# Output formats whose file is used as plain text when there is no JSON
+_TEXT_OUTPUT_FORMATS = frozenset({"txt", "srt", "vtt"})
+
+# Seconds a deep availability check result is reused; each check imports torch
+_DEEP_CHECK_TTL = 300
+
+# Run directories older than this are left over from a crashed process and
+# removed at startup; it is well above any processing timeout in practice
+_SCRATCH_MAX_AGE = 24 * 60 * 60
+
+
+def _wav_duration(path: Path) -> float:
+    """Duration in seconds of a WAV file, from its header (blocking)"""
+    with wave.open(str(path), "rb") as wav:
+        return wav.getnframes() / wav.getframerate()
+
+
+def _resolve_device(device: str) -> str:
+    """Resolve the configured WhisperX device, "auto" picking CUDA when torch sees a GPU"""
+    if device != "auto":
+        return device
+
+    try:
+        import torch
+        return "cuda" if torch.cuda.is_available() else "cpu"
+    except ImportError:
+        return "cpu"
+
+
+def _available_cpus() -> int:
+    """
+    Number of CPUs this process may use
+
+    Unlike os.cpu_count(), respects CPU affinity (e.g. docker --cpuset-cpus)
+    and a cgroup v2 CPU quota (docker --cpus).
+
+    Returns:
+        CPU count, at least 1
+    """
+    try:
+        cpus = len(os.sched_getaffinity(0))
+    except AttributeError:  # Not available on macOS and Windows
+        cpus = os.cpu_count() or 1
+
+    try:
+        quota, period = Path("/sys/fs/cgroup/cpu.max").read_text().split()
+        if quota != "max":
+            cpus = min(cpus, -(-int(quota) // int(period)))
+    except (OSError, ValueError):
+        pass
+
+    return max(1, cpus)
+
+
+def _default_batch_size() -> int:
+    """WhisperX batch size for CPU inference: half the available CPUs, between 1 and 32"""
+    return max(1, min(32, _available_cpus() // 2))
+
+
+async def _read_tail(stream: asyncio.StreamReader, limit: int = _OUTPUT_TAIL) -> bytes:
+    """
+    Read a stream to EOF, keeping only its last bytes
+
+    Args:
+        stream: Subprocess pipe to drain
+        limit: Number of trailing bytes to keep
+
+    Returns:
+        Last limit bytes of the stream
+    """
+    tail = bytearray()
+    while True:
+        chunk = await stream.read(_PIPE_CHUNK)
+        if not chunk:
+            return bytes(tail)
+        tail += chunk
+        if len(tail) > limit:
+            del tail[:-limit]
 
 
 class WhisperXTranscriber:
@@ -31,20 +139,111 @@ class WhisperXTranscriber:
         self.model_directory = Path(config.get("model_directory", "./models"))
         self.temp_directory = Path(config.get("temp_directory", "./temp"))
         self.timeout = config.get("processing_timeout", 600)  # 10 minutes default
+        # Longer files get proportionally more time, processing_timeout is the floor
+        self.timeout_per_audio_second = config.get("timeout_per_audio_second", 0.5)
+        self._ffprobe = shutil.which("ffprobe")
+
+        # Running WhisperX process, so the task manager can interrupt it
+        self.current_process: Optional[asyncio.subprocess.Process] = None
+
+        # How WhisperX runs: "subprocess" (one per file), "worker" (pool of
+        # long-lived processes) or "in_process" (inside the API process)
+        whisperx_config = config.get("whisperx", {})
+        self.device = _resolve_device(whisperx_config.get("device", "cpu"))
+        # Quantized inference by default: int8 on CPU, int8 weights with float16 math on GPU
+        self.default_compute_type = ComputeType(
+            whisperx_config.get("default_compute_type")
+            or ("int8_float16" if self.device == "cuda" else "int8")
+        )
+        self.batch_size = whisperx_config.get("batch_size") or _default_batch_size()
+        # CTranslate2 threads for one file; WhisperX itself defaults to 4 whatever the host
+        self.threads = whisperx_config.get("threads") or _available_cpus()
+        self.backend = whisperx_config.get("backend", "subprocess")
+        self._engine = WhisperXEngine(self.model_directory, self.threads, self.device) if self.backend == "in_process" else None
+        # One worker: tasks run one at a time, so more would only hold more model copies
+        self._workers = (
+            WhisperXWorkerPool(self.model_directory, 1, self.threads, self.device)
+            if self.backend == "worker" else None
+        )
 
-        # Ensure directories exist
-        self.temp_directory.mkdir(parents=True, exist_ok=True)
+        # Background decode of the file expected next (in-process backend)
+        self._prefetch: Optional[asyncio.Task] = None
+
+        # Result of the import check in check_availability, fixed for the process lifetime
+        self._availability: Optional[bool] = None
+
+        # (time.monotonic(), result) of the last deep check; the lock keeps
+        # concurrent /health?deep=true calls from starting several checks
+        self._deep_check: Optional[Tuple[float, bool]] = None
+        self._deep_check_lock = asyncio.Lock()
+
+        # (model directory st_mtime_ns, names) from the last get_available_models scan
+        self._models_cache: Optional[Tuple[Optional[int], List[str]]] = None
+
+        # One in-process inference at a time, concurrent callers queue here
+        # instead of competing for CTranslate2's own thread pool
+        self._infer_sem = asyncio.Semaphore(1)
 
-    async def check_availability(self) -> bool:
+        # Ensure directories exist
+        from core.config_loader import ensure_directory
+        ensure_directory(self.temp_directory)
+
+        # Per-run working directories live under one scratch directory, which
+        # other processes may share (uuid names keep their runs apart)
+        self._scratch = self.temp_directory / "scratch"
+        self._scratch.mkdir(exist_ok=True)
+        self._sweep_scratch()
+
+    def _sweep_scratch(self):
+        """Remove run directories left behind by crashed processes"""
+        cutoff = time.time() - _SCRATCH_MAX_AGE
+        for entry in self._scratch.iterdir():
+            try:
+                if entry.stat().st_mtime < cutoff:
+                    shutil.rmtree(entry, ignore_errors=True)
+            except OSError:
+                # Removed meanwhile by another process sharing the directory
+                pass
+
+    async def check_availability(self, deep: bool = False) -> bool:
         """
         Check if WhisperX is available and working
 
+        The default check only looks whisperx up on the import path, once per
+        process; the deep check runs the command line tool, which imports
+        torch and takes seconds, so its result is reused for _DEEP_CHECK_TTL.
+
+        Args:
+            deep: Run "python -m whisperx --help" instead of the cached import check
+
         Returns:
             True if WhisperX is available
         """
+        if not deep:
+            if self._availability is None:
+                self._availability = importlib.util.find_spec("whisperx") is not None
+                if not self._availability:
+                    self.logger.error("WhisperX is not installed")
+            return self._availability
+
+        async with self._deep_check_lock:
+            if self._deep_check is not None and time.monotonic() - self._deep_check[0] < _DEEP_CHECK_TTL:
+                return self._deep_check[1]
+
+            available = await self._run_deep_check()
+            self._deep_check = (time.monotonic(), available)
+            return available
+
+    async def _run_deep_check(self) -> bool:
+        """
+        Run the WhisperX command line tool with the interpreter serving the API
+
+        Returns:
+            True if "python -m whisperx --help" succeeds
+        """
         try:
             # Run a simple WhisperX command to check availability
-            cmd = ["python", "-m", "whisperx", "--help"]
+            cmd = [sys.executable, "-m", "whisperx", "--help"]
 
             process = await asyncio.create_subprocess_exec(
                 *cmd,
@@ -52,7 +251,12 @@ class WhisperXTranscriber:
                 stderr=asyncio.subprocess.PIPE
             )
 
-            stdout, stderr = await asyncio.wait_for(process.communicate(), timeout=10)
+            try:
+                stdout, stderr = await asyncio.wait_for(process.communicate(), timeout=10)
+            except asyncio.TimeoutError:
+                process.kill()
+                await process.wait()
+                raise
 
             if process.returncode == 0:
                 self.logger.info("WhisperX is available and working")
@@ -72,25 +276,33 @@ class WhisperXTranscriber:
         """
         Get list of available models
 
+        The model directory is only rescanned when its mtime changes, which
+        happens whenever a model directory is added, removed or renamed.
+
         Returns:
             List of available model names
         """
-        models = []
-
-        # Check for local models
-        if self.model_directory.exists():
-            for model_dir in self.model_directory.iterdir():
-                if model_dir.is_dir() and model_dir.name.startswith("faster-whisper-"):
-                    model_name = model_dir.name.replace("faster-whisper-", "")
-                    models.append(model_name)
-
-        # Add default models
-        default_models = ["tiny", "base", "small", "medium", "large"]
-        for model in default_models:
-            if model not in models:
-                models.append(model)
-
-        return sorted(models)
+        try:
+            mtime_ns = os.stat(self.model_directory).st_mtime_ns
+        except OSError:
+            mtime_ns = None
+
+        cached = self._models_cache
+        if cached is not None and cached[0] == mtime_ns:
+            return list(cached[1])
+
+        # Default models plus local ones; DirEntry.is_dir() uses the readdir
+        # entry type instead of a stat per entry
+        names = set(_DEFAULT_MODELS)
+        if mtime_ns is not None:
+            with os.scandir(self.model_directory) as entries:
+                for entry in entries:
+                    if entry.name.startswith(_MODEL_DIR_PREFIX) and entry.is_dir():
+                        names.add(entry.name[len(_MODEL_DIR_PREFIX):])
+
+        models = sorted(names)
+        self._models_cache = (mtime_ns, models)
+        return list(models)
 
     async def transcribe_file(
         self,
@@ -116,14 +328,15 @@ class WhisperXTranscriber:
 
         # Default request if none provided
         if request is None:
-            from api.models import WhisperModel, ComputeType, OutputFormat
             request = TranscribeRequest(
                 filename=filename,
                 model=WhisperModel.SMALL,
-                compute_type=ComputeType.FLOAT32,
                 output_format=OutputFormat.JSON
             )
 
+        if request.compute_type is None:
+            request = request.model_copy(update={"compute_type": self.default_compute_type})
+
         # Validate input file
         input_file = self.shared_directory / filename
         if not input_file.exists():
@@ -131,12 +344,25 @@ class WhisperXTranscriber:
 
         self.logger.info(f"Starting transcription of '{filename}' with model '{request.model}'")
 
-        # Create temporary directory for this transcription
-        with tempfile.TemporaryDirectory(dir=self.temp_directory) as temp_dir:
-            temp_path = Path(temp_dir)
-            output_dir = temp_path / "output"
-            output_dir.mkdir(exist_ok=True)
+        if self.backend != "subprocess":
+            data = await self._transcribe_with_loaded_model(input_file, request)
+            result = self._result_from_data(
+                filename=filename,
+                data=data,
+                request=request,
+                processing_time=(datetime.now() - start_time).total_seconds()
+            )
+
+            self.logger.info(f"Successfully transcribed '{filename}' in {result.processing_time:.2f}s")
+            return result
+
+        # Create a working directory for this transcription; it only receives
+        # WhisperX output, the input is read in place from the shared directory
+        temp_path = self._scratch / uuid.uuid4().hex
+        output_dir = temp_path / "output"
+        output_dir.mkdir(parents=True)
 
+        try:
             # Build WhisperX command
             cmd = await self._build_whisperx_command(
                 input_file=input_file,
@@ -145,7 +371,8 @@ class WhisperXTranscriber:
             )
 
             # Execute WhisperX
-            result_data = await self._execute_whisperx(cmd, temp_path)
+            timeout = await self._effective_timeout(input_file, request)
+            result_data = await self._execute_whisperx(cmd, temp_path, timeout)
 
             # Parse and format result
             result = await self._parse_whisperx_output(
@@ -159,6 +386,156 @@ class WhisperXTranscriber:
             self.logger.info(f"Successfully transcribed '{filename}' in {result.processing_time:.2f}s")
             return result
 
+        finally:
+            await asyncio.to_thread(shutil.rmtree, temp_path, ignore_errors=True)
+
+    def prefetch_audio(self, filename: str):
+        """
+        Start decoding a file expected to be transcribed next
+
+        Only the in-process backend shares decoded audio with this process,
+        so for the other backends this does nothing. At most one prefetch
+        runs at a time.
+
+        Args:
+            filename: Name of the audio file in the shared directory
+        """
+        if self._engine is None or (self._prefetch is not None and not self._prefetch.done()):
+            return
+
+        self._prefetch = asyncio.create_task(self._prefetch_audio(self.shared_directory / filename))
+
+    async def _prefetch_audio(self, input_file: Path):
+        """Decode an audio file into the engine's cache, ignoring failures"""
+        try:
+            await asyncio.to_thread(self._engine.load_audio, input_file)
+        except Exception as e:
+            self.logger.debug(f"Could not prefetch audio of '{input_file.name}': {e}")
+
+    async def _transcribe_with_loaded_model(
+        self,
+        input_file: Path,
+        request: TranscribeRequest
+    ) -> Dict[str, Any]:
+        """
+        Transcribe a file with a model that stays loaded between files
+
+        Args:
+            input_file: Path to input audio file
+            request: Transcription request parameters
+
+        Returns:
+            WhisperX result with segments, language and duration
+        """
+        if self._workers is not None:
+            timeout = await self._effective_timeout(input_file, request)
+            job = {
+                "op": "transcribe",
+                "input_file": str(input_file.resolve()),
+                "request": request.model_dump(mode="json"),
+                "batch_size": request.batch_size or self.batch_size
+            }
+            async with self._workers.worker() as worker:
+                # Exposed like a per-file subprocess, so interrupting kills the worker
+                self.current_process = worker.process
+                try:
+                    return await worker.run(job, timeout)
+                finally:
+                    self.current_process = None
+
+        # Inference runs on a worker thread, the loaded model is reused
+        async with self._infer_sem:
+            return await asyncio.to_thread(
+                self._engine.transcribe, input_file, request, request.batch_size or self.batch_size
+            )
+
+    async def warm_up(self):
+        """
+        Load the default model ahead of the first task when models stay loaded
+        """
+        if self.backend == "subprocess":
+            return
+
+        whisperx_config = self.config.get("whisperx", {})
+        request = TranscribeRequest(
+            filename="warm-up",
+            model=WhisperModel(whisperx_config.get("default_model", "small")),
+            compute_type=self.default_compute_type
+        )
+
+        try:
+            if self._workers is not None:
+                await self._workers.warm_up(request.model_dump(mode="json"))
+            else:
+                await asyncio.to_thread(self._engine.load_model, request)
+        except Exception as e:
+            self.logger.error(f"Failed to preload WhisperX model: {e}")
+
+    async def close(self):
+        """Stop WhisperX worker processes"""
+        if self._workers is not None:
+            await self._workers.close()
+
+    async def _effective_timeout(self, input_file: Path, request: TranscribeRequest) -> float:
+        """
+        Timeout for one WhisperX run, scaled with the audio length
+
+        Args:
+            input_file: Path to input audio file
+            request: Transcription request parameters
+
+        Returns:
+            Timeout in seconds: processing_timeout extended to
+            timeout_per_audio_second per second of audio, lowered to the
+            request's own timeout if that is shorter
+        """
+        duration = await self._probe_duration(input_file)
+        timeout = self.timeout
+        if duration is not None:
+            timeout = max(timeout, duration * self.timeout_per_audio_second)
+
+        # Clients may only shorten the limit that protects the processing slot
+        if request.timeout:
+            timeout = min(timeout, request.timeout)
+        return timeout
+
+    async def _probe_duration(self, input_file: Path) -> Optional[float]:
+        """
+        Read the audio duration from the file header
+
+        Args:
+            input_file: Path to input audio file
+
+        Returns:
+            Duration in seconds or None if it cannot be determined
+        """
+        try:
+            if input_file.suffix.lower() == ".wav":
+                return await asyncio.to_thread(_wav_duration, input_file)
+
+            if self._ffprobe is None:
+                return None
+
+            process = await asyncio.create_subprocess_exec(
+                self._ffprobe, "-v", "error",
+                "-show_entries", "format=duration",
+                "-of", "default=noprint_wrappers=1:nokey=1",
+                str(input_file),
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL
+            )
+            try:
+                stdout, _ = await asyncio.wait_for(process.communicate(), timeout=10)
+            except asyncio.TimeoutError:
+                process.kill()
+                await process.wait()
+                return None
+            return float(stdout) if process.returncode == 0 else None
+
+        except Exception as e:
+            self.logger.debug(f"Could not read duration of '{input_file.name}': {e}")
+            return None
+
     async def _build_whisperx_command(
         self,
         input_file: Path,
@@ -177,14 +554,15 @@ class WhisperXTranscriber:
             Command line arguments list
         """
         cmd = [
-            "python", "-m", "whisperx",
+            sys.executable, "-m", "whisperx",
             str(input_file),
             "--output_dir", str(output_dir),
             "--output_format", request.output_format.value,
             "--model", request.model.value,
             "--compute_type", request.compute_type.value,
-            "--device", "cpu",  # Force CPU for now
-            "--batch_size", "16"
+            "--device", self.device,
+            "--batch_size", str(request.batch_size or self.batch_size),
+            "--threads", str(self.threads)
         ]
 
         # Add language if specified
@@ -192,7 +570,7 @@ class WhisperXTranscriber:
             cmd.extend(["--language", request.language])
 
         # Add model directory if available
-        model_path = self.model_directory / f"faster-whisper-{request.model.value}"
+        model_path = self.model_directory / f"{_MODEL_DIR_PREFIX}{request.model.value}"
         if model_path.exists():
             cmd.extend(["--model_dir", str(model_path)])
 
@@ -216,7 +594,8 @@ class WhisperXTranscriber:
     async def _execute_whisperx(
         self,
         cmd: List[str],
-        working_dir: Path
+        working_dir: Path,
+        timeout: Optional[float] = None
     ) -> Optional[Dict[str, Any]]:
         """
         Execute WhisperX subprocess with timeout and error handling
@@ -224,14 +603,18 @@ class WhisperXTranscriber:
         Args:
             cmd: Command line arguments
             working_dir: Working directory for the process
+            timeout: Seconds before the process is killed (default: processing_timeout)
 
         Returns:
-            Raw output data from WhisperX
+            Raw output data from WhisperX (the tail of its stdout)
 
         Raises:
             subprocess.TimeoutExpired: If process times out
             subprocess.CalledProcessError: If process fails
         """
+        if timeout is None:
+            timeout = self.timeout
+
         try:
             # Create subprocess
             process = await asyncio.create_subprocess_exec(
@@ -242,13 +625,16 @@ class WhisperXTranscriber:
             )
 
             # Store process reference for potential interruption
-            # This would be set in the task manager
-            # self._current_process = process
-
-            # Wait for completion with timeout
-            stdout, stderr = await asyncio.wait_for(
-                process.communicate(),
-                timeout=self.timeout
+            self.current_process = process
+
+            # Drain both pipes while waiting for completion, with timeout
+            stdout, stderr, _ = await asyncio.wait_for(
+                asyncio.gather(
+                    _read_tail(process.stdout),
+                    _read_tail(process.stderr),
+                    process.wait()
+                ),
+                timeout=timeout
             )
 
             # Check return code
@@ -264,17 +650,20 @@ class WhisperXTranscriber:
             return {"stdout": stdout.decode('utf-8', errors='replace')}
 
         except asyncio.TimeoutError:
-            self.logger.error(f"WhisperX process timed out after {self.timeout} seconds")
+            self.logger.error(f"WhisperX process timed out after {timeout:.0f} seconds")
             # Kill the process if it's still running
             if process.returncode is None:
                 process.kill()
                 await process.wait()
-            raise subprocess.TimeoutExpired(cmd, self.timeout)
+            raise subprocess.TimeoutExpired(cmd, timeout)
 
         except Exception as e:
             self.logger.error(f"Error executing WhisperX: {e}")
             raise
 
+        finally:
+            self.current_process = None
+
     async def _parse_whisperx_output(
         self,
         filename: str,
@@ -296,86 +685,26 @@ class WhisperXTranscriber:
         Returns:
             Structured transcription result
         """
-        # Find the JSON output file
-        base_name = Path(filename).stem
-        json_file = None
-
-        # Look for JSON output
-        for ext in ['.json']:
-            potential_file = output_dir / f"{base_name}{ext}"
-            if potential_file.exists():
-                json_file = potential_file
-                break
-
-        if not json_file:
-            # If no JSON file, create basic result from other formats
+        # WhisperX writes only the requested format, so there is no JSON to look for
+        if request.output_format.value != "json":
             return await self._create_fallback_result(
                 filename, output_dir, request, processing_time
             )
 
+        json_file = output_dir / f"{Path(filename).stem}.json"
+
         try:
-            # Parse JSON result
-            with open(json_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-
-            # Extract segments
-            segments = []
-            full_text = ""
-            word_count = 0
-            confidence_scores = []
-
-            if isinstance(data, dict) and "segments" in data:
-                for seg_data in data["segments"]:
-                    segment = TranscriptionSegment(
-                        start=seg_data.get("start", 0.0),
-                        end=seg_data.get("end", 0.0),
-                        text=seg_data.get("text", "").strip(),
-                        confidence=seg_data.get("confidence"),
-                        words=seg_data.get("words", [])
-                    )
-                    segments.append(segment)
-
-                    # Accumulate text and statistics
-                    if segment.text:
-                        full_text += segment.text + " "
-                        word_count += len(segment.text.split())
-
-                    if segment.confidence is not None:
-                        confidence_scores.append(segment.confidence)
-
-            # Calculate average confidence
-            confidence_avg = None
-            if confidence_scores:
-                confidence_avg = sum(confidence_scores) / len(confidence_scores)
-
-            # Get audio duration
-            duration = 0.0
-            if segments:
-                duration = max(seg.end for seg in segments)
-            elif isinstance(data, dict) and "duration" in data:
-                duration = data["duration"]
-
-            # Detect language
-            language = request.language or "auto"
-            if isinstance(data, dict) and "language" in data:
-                language = data["language"]
-
-            # Create result
-            result = TranscriptionResult(
-                filename=filename,
-                language=language,
-                duration=duration,
-                text=full_text.strip(),
-                segments=segments,
-                word_count=word_count,
-                confidence_avg=confidence_avg,
-                model_used=request.model.value,
-                processing_time=processing_time,
-                timestamp=datetime.now()
-            )
+            # Parse JSON result; reading it directly saves a separate exists() stat,
+            # and the read runs on a thread so a large file does not stall the loop
+            data = _json_loads(await asyncio.to_thread(json_file.read_bytes))
 
-            self.logger.info(f"Parsed transcription result: {word_count} words, {len(segments)} segments")
-            return result
+            return self._result_from_data(filename, data, request, processing_time)
+
+        except FileNotFoundError:
+            # If no JSON file, create basic result from other formats
+            return await self._create_fallback_result(
+                filename, output_dir, request, processing_time
+            )
 
         except Exception as e:
             self.logger.error(f"Error parsing WhisperX JSON output: {e}")
@@ -384,6 +713,85 @@ class WhisperXTranscriber:
                 filename, output_dir, request, processing_time
             )
 
+    def _result_from_data(
+        self,
+        filename: str,
+        data: Any,
+        request: TranscribeRequest,
+        processing_time: float
+    ) -> TranscriptionResult:
+        """
+        Create a structured result from WhisperX output data
+
+        Args:
+            filename: Original filename
+            data: WhisperX result (parsed JSON file or in-process result dict)
+            request: Original request parameters
+            processing_time: Time taken to process
+
+        Returns:
+            Structured transcription result
+        """
+        # Extract segments and their statistics in one pass
+        segments = []
+        text_parts = []
+        word_count = 0
+        confidence_sum = 0.0
+        confidence_count = 0
+        duration = 0.0
+
+        if isinstance(data, dict) and "segments" in data:
+            for seg_data in data["segments"]:
+                segment = TranscriptionSegment(
+                    start=seg_data.get("start", 0.0),
+                    end=seg_data.get("end", 0.0),
+                    text=seg_data.get("text", "").strip(),
+                    confidence=seg_data.get("confidence"),
+                    words=seg_data.get("words", [])
+                )
+                segments.append(segment)
+
+                # Accumulate text and statistics
+                if segment.end > duration:
+                    duration = segment.end
+
+                if segment.text:
+                    text_parts.append(segment.text)
+                    word_count += len(segment.text.split())
+
+                if segment.confidence is not None:
+                    confidence_sum += segment.confidence
+                    confidence_count += 1
+
+        # Calculate average confidence
+        confidence_avg = confidence_sum / confidence_count if confidence_count else None
+
+        # Without segments, fall back to the duration WhisperX reported
+        if not segments and isinstance(data, dict) and "duration" in data:
+            duration = data["duration"]
+
+        # Detect language
+        language = request.language or "auto"
+        if isinstance(data, dict) and "language" in data:
+            language = data["language"]
+
+        # Create result
+        result = TranscriptionResult(
+            filename=filename,
+            language=language,
+            duration=duration,
+            text=" ".join(text_parts),
+            segments=segments,
+            word_count=word_count,
+            confidence_avg=confidence_avg,
+            model_used=request.model.value,
+            processing_time=processing_time,
+            timestamp=datetime.now()
+        )
+
+        self.logger.info(f"Parsed transcription result: {word_count} words, {len(segments)} segments")
+        return result
+
     async def _create_fallback_result(
         self,
         filename: str,
@@ -403,19 +811,17 @@ class WhisperXTranscriber:
         Returns:
             Basic transcription result
         """
-        base_name = Path(filename).stem
-
-        # Try to read text file
+        # Read the text file of the requested format, if it is a text format
         text_content = ""
-        for ext in ['.txt', '.srt', '.vtt']:
-            text_file = output_dir / f"{base_name}{ext}"
-            if text_file.exists():
-                try:
-                    with open(text_file, 'r', encoding='utf-8') as f:
-                        text_content = f.read().strip()
-                    break
-                except Exception as e:
-                    self.logger.warning(f"Could not read {text_file}: {e}")
+        output_format = request.output_format.value
+        if output_format in _TEXT_OUTPUT_FORMATS:
+            text_file = output_dir / f"{Path(filename).stem}.{output_format}"
+            try:
+                text_content = (await asyncio.to_thread(text_file.read_text, encoding='utf-8')).strip()
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                self.logger.warning(f"Could not read {text_file}: {e}")
 
         # Create basic segment if we have text
         segments = []
@@ -440,3 +846,16 @@ class WhisperXTranscriber:
             processing_time=processing_time,
             timestamp=datetime.now()
         )
+
+
+# Global transcriber instance
+_transcriber: Optional[WhisperXTranscriber] = None
+
+
+def get_transcriber() -> WhisperXTranscriber:
+    """Get the global transcriber instance"""
+    global _transcriber
+    if _transcriber is None:
+        from core.config_loader import get_config
+        _transcriber = WhisperXTranscriber(get_config())
+    return _transcriber
@@ -0,0 +1,221 @@
+"""
+WhisperX Engine
+Runs WhisperX through its Python API with models kept loaded between files
+"""
+
+import dataclasses
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Any, Tuple
+
+from api.models import TranscribeRequest
+from core.logger import get_logger
+
+
+# Total size of decoded audio kept for retries of failed files and prefetched
+# files; an hour of 16 kHz float32 audio is about 230 MB
+_AUDIO_CACHE_BYTES = 256 * 1024 * 1024
+
+
+def _audio_size(audio) -> int:
+    """Memory used by decoded samples (float32 when not a NumPy array)"""
+    return getattr(audio, "nbytes", len(audio) * 4)
+
+
+class WhisperXEngine:
+    """
+    Loads WhisperX models once and transcribes files with them
+
+    All methods block; call them from a worker thread or a worker process.
+    """
+
+    def __init__(self, model_directory: Path, threads: int = 4, device: str = "cpu"):
+        self.model_directory = Path(model_directory)
+        self.threads = threads
+        self.device = device
+        self.logger = get_logger(__name__)
+
+        # Loaded models, kept for the process lifetime
+        self._models: Dict[Tuple[Any, ...], Any] = {}
+        self._align_models: Dict[str, Tuple[Any, Any]] = {}
+        self._models_lock = threading.Lock()
+
+        # Decoded audio keyed by (path, st_mtime_ns, st_size), least recently used first
+        self._audio: "OrderedDict[Tuple[str, int, int], Any]" = OrderedDict()
+        self._audio_bytes = 0
+        self._audio_lock = threading.Lock()
+
+    def transcribe(
+        self,
+        input_file: Path,
+        request: TranscribeRequest,
+        batch_size: int = 16
+    ) -> Dict[str, Any]:
+        """
+        Transcribe and align an audio file
+
+        Args:
+            input_file: Path to input audio file
+            request: Transcription request parameters
+            batch_size: Number of audio chunks decoded together
+
+        Returns:
+            WhisperX result with segments, language and duration
+        """
+        import whisperx
+
+        model = self.load_model(request)
+        self._apply_options(model, request)
+
+        audio = self.load_audio(input_file)
+        result = model.transcribe(audio, batch_size=batch_size, language=request.language)
+        language = result.get("language") or request.language
+
+        # Word-level alignment, as the command line tool does by default
+        try:
+            align_model, metadata = self.load_align_model(language)
+            aligned = whisperx.align(
+                result["segments"], align_model, metadata, audio, self.device,
+                return_char_alignments=False
+            )
+            result["segments"] = aligned["segments"]
+        except Exception as e:
+            self.logger.warning(f"Alignment failed for '{input_file.name}', keeping unaligned segments: {e}")
+
+        result["language"] = language
+        result["duration"] = len(audio) / whisperx.audio.SAMPLE_RATE
+
+        # Only a retry after a failure needs the decoded audio again
+        self._forget_audio(input_file)
+        return result
+
+    def load_audio(self, input_file: Path):
+        """
+        Decode an audio file with ffmpeg, reusing the result while the file is unchanged
+
+        Args:
+            input_file: Path to input audio file
+
+        Returns:
+            16 kHz mono float32 samples
+        """
+        import whisperx
+
+        stat = input_file.stat()
+        key = (str(input_file.resolve()), stat.st_mtime_ns, stat.st_size)
+
+        with self._audio_lock:
+            audio = self._audio.get(key)
+            if audio is not None:
+                self._audio.move_to_end(key)
+                return audio
+
+        audio = whisperx.load_audio(str(input_file))
+        size = _audio_size(audio)
+
+        with self._audio_lock:
+            if size <= _AUDIO_CACHE_BYTES and key not in self._audio:
+                self._audio[key] = audio
+                self._audio_bytes += size
+                while self._audio_bytes > _AUDIO_CACHE_BYTES:
+                    _, evicted = self._audio.popitem(last=False)
+                    self._audio_bytes -= _audio_size(evicted)
+
+        return audio
+
+    def _forget_audio(self, input_file: Path):
+        """
+        Drop cached decoded audio of a file
+
+        Args:
+            input_file: Path to input audio file
+        """
+        path = str(input_file.resolve())
+        with self._audio_lock:
+            for key in [key for key in self._audio if key[0] == path]:
+                audio = self._audio.pop(key)
+                self._audio_bytes -= _audio_size(audio)
+
+    def load_model(self, request: TranscribeRequest):
+        """
+        Return the WhisperX model for a request, loading it on first use
+
+        Models are cached by model name, compute type and device only; decoding
+        options come from each request (see _apply_options), so varying them
+        never loads another copy of the model.
+
+        Args:
+            request: Transcription request parameters
+
+        Returns:
+            Loaded WhisperX pipeline
+        """
+        key = (request.model.value, request.compute_type.value, self.device)
+
+        with self._models_lock:
+            model = self._models.get(key)
+            if model is None:
+                import whisperx
+
+                self.logger.info(f"Loading WhisperX model '{request.model.value}' ({request.compute_type.value})")
+
+                # Use the local model directory if available
+                model_path = self.model_directory / f"faster-whisper-{request.model.value}"
+                model = whisperx.load_model(
+                    request.model.value,
+                    self.device,
+                    compute_type=request.compute_type.value,
+                    threads=self.threads,
+                    download_root=str(model_path) if model_path.exists() else None
+                )
+                self._models[key] = model
+
+            return model
+
+    @staticmethod
+    def _apply_options(model, request: TranscribeRequest):
+        """
+        Set a request's decoding options on a cached WhisperX pipeline
+
+        Args:
+            model: Loaded WhisperX pipeline
+            request: Transcription request parameters
+        """
+        options = {
+            "beam_size": request.beam_size,
+            "best_of": request.best_of,
+            "patience": request.patience,
+            "temperatures": [request.temperature],
+        }
+        # TranscriptionOptions is a NamedTuple in older faster-whisper, a dataclass in newer
+        if hasattr(model.options, "_replace"):
+            model.options = model.options._replace(**options)
+        else:
+            model.options = dataclasses.replace(model.options, **options)
+
+        # The pipeline keeps the tokenizer of the previous file; drop it so the
+        # language is detected again when the request does not set one
+        if request.language is None:
+            model.tokenizer = None
+
+    def load_align_model(self, language: str) -> Tuple[Any, Any]:
+        """
+        Return the alignment model and metadata for a language, loading it on first use
+
+        Args:
+            language: Language code detected or requested
+
+        Returns:
+            (alignment model, metadata) pair
+        """
+        with self._models_lock:
+            align_model = self._align_models.get(language)
+            if align_model is None:
+                import whisperx
+
+                self.logger.info(f"Loading WhisperX alignment model for '{language}'")
+                align_model = whisperx.load_align_model(language_code=language, device=self.device)
+                self._align_models[language] = align_model
+
+            return align_model
@@ -0,0 +1,285 @@
+"""
+WhisperX Worker Processes
+Long-lived worker processes that keep WhisperX models loaded between files
+
+Run as ``python -m core.whisperx_worker <model_directory> [threads] [device]``: the worker reads
+one JSON job per line from stdin and answers each with one JSON line on stdout.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import subprocess
+import sys
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import Dict, List, Optional, Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is listed in requirements.txt
+    orjson = None
+
+from api.models import TranscribeRequest
+from core.logger import get_logger
+
+
+# Workers import the project packages, so they run from the project root
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+# Largest reply line accepted from a worker (a long transcript with word timings)
+_MAX_REPLY = 64 * 1024 * 1024
+
+# Trailing bytes of worker stderr kept for error messages
+_STDERR_TAIL = 64 * 1024
+
+
+def _to_builtin(value: Any) -> Any:
+    """Convert NumPy scalars and arrays in WhisperX results for JSON encoding"""
+    if hasattr(value, "tolist"):
+        return value.tolist()
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+if orjson is not None:
+    _json_loads = orjson.loads
+
+    def _json_line(data: Any) -> bytes:
+        """Serialize data to a single JSON line"""
+        return orjson.dumps(data, default=_to_builtin) + b"\n"
+else:
+    _json_loads = json.loads
+
+    def _json_line(data: Any) -> bytes:
+        """Serialize data to a single JSON line"""
+        return json.dumps(data, default=_to_builtin, ensure_ascii=False).encode("utf-8") + b"\n"
+
+
+class WhisperXWorker:
+    """
+    Handle on one worker process, started on first use and after it exits
+    """
+
+    def __init__(self, model_directory: Path, threads: int = 4, device: str = "cpu"):
+        self.model_directory = Path(model_directory).resolve()
+        self.threads = threads
+        self.device = device
+        self.logger = get_logger(__name__)
+
+        self.process: Optional[asyncio.subprocess.Process] = None
+        self._stderr_task: Optional[asyncio.Task] = None
+        self._stderr_tail = bytearray()
+
+    @property
+    def command(self) -> List[str]:
+        """Command line of the worker process"""
+        return [
+            sys.executable, "-m", "core.whisperx_worker",
+            str(self.model_directory), str(self.threads), self.device
+        ]
+
+    @property
+    def alive(self) -> bool:
+        """Whether the worker process is running"""
+        return self.process is not None and self.process.returncode is None
+
+    async def start(self):
+        """Start the worker process"""
+        self._stderr_tail.clear()
+        self.process = await asyncio.create_subprocess_exec(
+            *self.command,
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            cwd=_PROJECT_ROOT,
+            limit=_MAX_REPLY
+        )
+        self._stderr_task = asyncio.create_task(self._drain_stderr(self.process))
+        self.logger.info(f"Started WhisperX worker (pid {self.process.pid})")
+
+    async def _drain_stderr(self, process: asyncio.subprocess.Process):
+        """Keep reading worker stderr so it never blocks, remembering the tail"""
+        while True:
+            chunk = await process.stderr.read(_STDERR_TAIL)
+            if not chunk:
+                return
+            self._stderr_tail += chunk
+            if len(self._stderr_tail) > _STDERR_TAIL:
+                del self._stderr_tail[:-_STDERR_TAIL]
+
+    async def run(self, job: Dict[str, Any], timeout: Optional[float] = None) -> Any:
+        """
+        Send one job to the worker and wait for its reply
+
+        Args:
+            job: Job description (see _handle_job)
+            timeout: Seconds before the worker is killed, None to wait indefinitely
+
+        Returns:
+            The job's result
+
+        Raises:
+            subprocess.TimeoutExpired: If the job times out
+            subprocess.CalledProcessError: If the worker exits during the job
+            RuntimeError: If WhisperX fails on the job or its reply is too long
+        """
+        if not self.alive:
+            await self.start()
+        process = self.process
+
+        try:
+            process.stdin.write(_json_line(job))
+            await process.stdin.drain()
+            line = await asyncio.wait_for(process.stdout.readline(), timeout=timeout)
+        except asyncio.TimeoutError:
+            self.logger.error(f"WhisperX worker timed out after {timeout:.0f} seconds")
+            process.kill()
+            await self.stop()
+            raise subprocess.TimeoutExpired(self.command, timeout)
+        except (BrokenPipeError, ConnectionResetError):
+            line = b""
+        except BaseException as e:
+            # The reply is left (partly) unread, e.g. cancelled or too long for
+            # readline; the next job would read it as its own, so the worker goes
+            process.kill()
+            await self.stop()
+            if isinstance(e, ValueError):
+                raise RuntimeError(f"WhisperX worker reply exceeds {_MAX_REPLY} bytes") from e
+            raise
+
+        if not line:
+            # The worker exited, e.g. killed by interrupt_processing
+            await process.wait()
+            if self._stderr_task:
+                await self._stderr_task
+            stderr = self._stderr_tail.decode("utf-8", errors="replace")
+            raise subprocess.CalledProcessError(process.returncode, self.command, stderr=stderr)
+
+        reply = _json_loads(line)
+        if not reply.get("ok"):
+            raise RuntimeError(f"WhisperX worker failed: {reply.get('error')}")
+        return reply.get("result")
+
+    async def stop(self, timeout: float = 5):
+        """
+        Stop the worker process, killing it if it does not exit in time
+
+        Args:
+            timeout: Seconds to wait for a clean exit after closing stdin
+        """
+        process = self.process
+        if process is None:
+            return
+
+        if process.returncode is None:
+            # Workers exit when their stdin closes
+            process.stdin.close()
+            try:
+                await asyncio.wait_for(process.wait(), timeout=timeout)
+            except asyncio.TimeoutError:
+                process.kill()
+                await process.wait()
+
+        if self._stderr_task:
+            self._stderr_task.cancel()
+            self._stderr_task = None
+        self.process = None
+
+
+class WhisperXWorkerPool:
+    """
+    Fixed set of WhisperX workers handed out one job at a time
+    """
+
+    def __init__(self, model_directory: Path, size: int = 1, threads: int = 4, device: str = "cpu"):
+        self._workers = [WhisperXWorker(model_directory, threads, device) for _ in range(max(1, size))]
+
+        # Idle workers; a job takes one and puts it back when done
+        self._idle: asyncio.Queue = asyncio.Queue()
+        for worker in self._workers:
+            self._idle.put_nowait(worker)
+
+    @asynccontextmanager
+    async def worker(self):
+        """Borrow an idle, running worker for the duration of a job"""
+        worker = await self._idle.get()
+        try:
+            if not worker.alive:
+                await worker.start()
+            yield worker
+        finally:
+            self._idle.put_nowait(worker)
+
+    async def warm_up(self, request: Dict[str, Any]):
+        """
+        Start every worker and have it load the model for a request
+
+        Args:
+            request: TranscribeRequest fields (JSON mode) selecting the model
+        """
+        async def load():
+            async with self.worker() as worker:
+                await worker.run({"op": "load", "request": request})
+
+        await asyncio.gather(*(load() for _ in self._workers))
+
+    async def close(self):
+        """Stop all worker processes"""
+        await asyncio.gather(*(worker.stop() for worker in self._workers))
+
+
+def _handle_job(engine, job: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Run one job inside the worker process
+
+    Jobs are {"op": "transcribe", "input_file": path, "request": {...},
+    "batch_size": n} or {"op": "load", "request": {...}}, where request holds
+    TranscribeRequest fields.
+
+    Args:
+        engine: WhisperXEngine of this worker
+        job: Parsed job line
+
+    Returns:
+        Reply sent back to the parent process
+    """
+    try:
+        request = TranscribeRequest.model_validate(job["request"])
+        if job.get("op") == "load":
+            engine.load_model(request)
+            return {"ok": True}
+        result = engine.transcribe(Path(job["input_file"]), request, job.get("batch_size", 16))
+        return {"ok": True, "result": result}
+    except Exception as e:
+        return {"ok": False, "error": f"{type(e).__name__}: {e}"}
+
+
+def main():
+    """Worker process entry point"""
+    from core.whisperx_engine import WhisperXEngine
+
+    # Replies own the real stdout; anything WhisperX or torch prints goes to stderr
+    replies = os.fdopen(os.dup(sys.stdout.fileno()), "wb", buffering=0)
+    os.dup2(sys.stderr.fileno(), sys.stdout.fileno())
+    sys.stdout = sys.stderr
+
+    logging.basicConfig(
+        stream=sys.stderr,
+        level=logging.INFO,
+        format='[%(asctime)s] [%(levelname)s] [%(name)s] %(message)s'
+    )
+
+    engine = WhisperXEngine(
+        Path(sys.argv[1]) if len(sys.argv) > 1 else Path("./models"),
+        int(sys.argv[2]) if len(sys.argv) > 2 else 4,
+        sys.argv[3] if len(sys.argv) > 3 else "cpu"
+    )
+
+    for line in sys.stdin.buffer:
+        if line.strip():
+            replies.write(_json_line(_handle_job(engine, _json_loads(line))))
+
+
+if __name__ == "__main__":
+    main()
@@ -4,22 +4,27 @@ Model initialization script for WhisperX Audio Transcriber
 Downloads required models if they don't exist locally
 """
 
+import importlib.util
 import os
 import sys
-import subprocess
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
-# Add parent directory to path for imports
-sys.path.append(str(Path(__file__).parent.parent))
+# Files every downloaded faster-whisper model directory must contain
+REQUIRED_MODEL_FILES = frozenset({'config.json', 'model.bin', 'tokenizer.json', 'vocabulary.txt'})
+
+# Download large files over parallel connections when hf_transfer is installed;
+# huggingface_hub reads this when it is first imported
+if importlib.util.find_spec("hf_transfer") is not None:
+    os.environ.setdefault("HF_HUB_ENABLE_HF_TRANSFER", "1")
 
 def check_huggingface_hub():
-    """Check if huggingface_hub is available"""
-    try:
-        import huggingface_hub
+    """Check if huggingface_hub is available, without importing it"""
+    if importlib.util.find_spec("huggingface_hub") is not None:
         return True
-    except ImportError:
-        print("❌ huggingface_hub не установлен")
-        return False
+
+    print("❌ huggingface_hub не установлен")
+    return False
 
 def download_model(model_name, local_dir):
     """Download model using huggingface_hub"""
@@ -31,7 +36,8 @@ def download_model(model_name, local_dir):
         snapshot_download(
             repo_id=f"Systran/{model_name}",
             local_dir=local_dir,
-            local_dir_use_symlinks=False
+            local_dir_use_symlinks=False,
+            max_workers=8  # Parallel file downloads within the model
         )
         print(f"✅ Модель {model_name} успешно скачана")
         return True
@@ -41,16 +47,14 @@ def download_model(model_name, local_dir):
 
 def check_model_exists(model_dir):
     """Check if model files exist"""
-    model_path = Path(model_dir)
-    if not model_path.exists():
+    # One directory listing instead of a stat per required file
+    try:
+        with os.scandir(model_dir) as entries:
+            names = {entry.name for entry in entries}
+    except (FileNotFoundError, NotADirectoryError):
         return False
 
-    required_files = ['config.json', 'model.bin', 'tokenizer.json', 'vocabulary.txt']
-    for file in required_files:
-        if not (model_path / file).exists():
-            return False
-
-    return True
+    return REQUIRED_MODEL_FILES.issubset(names)
 
 def main():
     """Main initialization function"""
@@ -69,6 +73,7 @@ def main():
     ]
 
     success_count = 0
+    missing = []
 
     for model_name, local_dirname in models_to_download:
         local_dir = models_dir / local_dirname
@@ -78,10 +83,20 @@ def main():
             success_count += 1
         else:
             # Create directory if it doesn't exist
-            local_dir.mkdir(exist_ok=True)
-
-            if download_model(model_name, str(local_dir)):
-                success_count += 1
+            local_dir.mkdir(parents=True, exist_ok=True)
+            missing.append((model_name, local_dir))
+
+    # Downloads are network-bound, so fetch missing models concurrently;
+    # three at a time keeps within Hugging Face rate limits
+    if missing:
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            futures = [
+                executor.submit(download_model, model_name, str(local_dir))
+                for model_name, local_dir in missing
+            ]
+            for future in as_completed(futures):
+                if future.result():
+                    success_count += 1
 
     print(f"\n🎯 Результат: {success_count}/{len(models_to_download)} моделей готовы к использованию")
 
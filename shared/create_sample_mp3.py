@@ -1,11 +1,24 @@
-from gtts import gTTS
-import os
+import hashlib
+import shutil
+from pathlib import Path
 
-def create_sample_mp3(text, filename):
-    tts = gTTS(text=text, lang='ru')
-    tts.save(filename)
+# Generated speech is cached, so repeated runs do not call Google TTS again
+CACHE_DIR = Path.home() / ".cache" / "audio-transcriber" / "tts"
+
+def create_sample_mp3(text, filename, lang='ru'):
+    key = hashlib.sha1(f"{lang}:{text}".encode("utf-8")).hexdigest()
+    cached = CACHE_DIR / f"{key}.mp3"
+
+    if not cached.exists():
+        from gtts import gTTS
+
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp = cached.with_suffix(".tmp")
+        gTTS(text=text, lang=lang).save(str(tmp))
+        tmp.replace(cached)
+
+    shutil.copyfile(cached, filename)
     print(f"Аудиофайл '{filename}' успешно создан.")
 
 if __name__ == "__main__":
     create_sample_mp3("Ты сакс", "sample.mp3")
-